@@ -2,11 +2,11 @@ import re
 import unittest.mock
 from abc import ABC, abstractmethod
 from enum import auto
-from typing import IO, Any, ClassVar, Dict, List, Optional, Type, TypeVar
+from typing import IO, Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
 
 import pydantic
 from cached_property import cached_property
-from pydantic import BaseModel, Extra, ValidationError
+from pydantic import BaseModel, Extra, PrivateAttr, ValidationError
 from pydantic.fields import Field
 from typing_extensions import Protocol, runtime_checkable
 
@@ -237,6 +237,15 @@ class AllowDenyPattern(ConfigModel):
         description="Whether to ignore case sensitivity during pattern matching.",
     )  # Name comparisons should default to ignoring case
 
+    # Sources tend to probe the same names repeatedly (once per aspect or per
+    # run stage), so decisions are memoized per input. Some sources mutate
+    # their patterns after construction (e.g. the bigquery profiler appends
+    # deny rules mid-run), so the cache is fingerprinted against the pattern
+    # contents and dropped whenever they change.
+    _allowed_cache: Dict[str, bool] = PrivateAttr(default_factory=dict)
+    _allowed_cache_fingerprint: Optional[Tuple] = PrivateAttr(default=None)
+    _ALLOWED_CACHE_MAX_SIZE: ClassVar[int] = 4096
+
     @property
     def regex_flags(self) -> int:
         return re.IGNORECASE if self.ignoreCase else 0
@@ -246,6 +255,22 @@ class AllowDenyPattern(ConfigModel):
         return AllowDenyPattern()
 
     def allowed(self, string: str) -> bool:
+        fingerprint = (tuple(self.allow), tuple(self.deny), self.ignoreCase)
+        if fingerprint != self._allowed_cache_fingerprint:
+            self._allowed_cache.clear()
+            self._allowed_cache_fingerprint = fingerprint
+        else:
+            try:
+                return self._allowed_cache[string]
+            except KeyError:
+                pass
+
+        result = self._matches(string)
+        if len(self._allowed_cache) < self._ALLOWED_CACHE_MAX_SIZE:
+            self._allowed_cache[string] = result
+        return result
+
+    def _matches(self, string: str) -> bool:
         for deny_pattern in self.deny:
             if re.match(deny_pattern, string, self.regex_flags):
                 return False
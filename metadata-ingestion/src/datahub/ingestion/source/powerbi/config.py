@@ -287,6 +287,11 @@ class PowerBiDashboardSourceConfig(
         le=100,
         description="batch size for sending workspace_ids to PBI, 100 is the limit",
     )
+    scan_workers: int = pydantic.Field(
+        default=4,
+        ge=1,
+        description="number of threads used to fetch workspace metadata from the PowerBI API in parallel",
+    )
     workspace_id_as_urn_part: bool = pydantic.Field(
         default=False,
         description="Highly recommend changing this to True, as you can have the same workspace name"
@@ -10,6 +10,11 @@ from datahub.ingestion.source.powerbi.m_query.resolver import DataPlatformTable
 
 logger = logging.getLogger(__name__)
 
+# Fallback detail for tables without an explicit mapping; built once since
+# pydantic parsing is too costly to repeat per upstream table and callers
+# only ever read it
+_DEFAULT_PLATFORM_DETAIL: PlatformDetail = PlatformDetail.parse_obj({})
+
 
 class AbstractDataPlatformInstanceResolver(ABC):
     @abstractmethod
@@ -41,7 +46,7 @@ class ResolvePlatformInstanceFromDatasetTypeMapping(
         if isinstance(platform, PlatformDetail):
             return platform
 
-        return PlatformDetail.parse_obj({})
+        return _DEFAULT_PLATFORM_DETAIL
 
 
 class ResolvePlatformInstanceFromServerToPlatformInstance(
@@ -50,13 +55,9 @@ class ResolvePlatformInstanceFromServerToPlatformInstance(
     def get_platform_instance(
         self, dataplatform_table: DataPlatformTable
     ) -> PlatformDetail:
-        return (
-            self.config.server_to_platform_instance[
-                dataplatform_table.datasource_server
-            ]
-            if dataplatform_table.datasource_server
-            in self.config.server_to_platform_instance
-            else PlatformDetail.parse_obj({})
+        # Single dict lookup instead of a membership test followed by an index
+        return self.config.server_to_platform_instance.get(
+            dataplatform_table.datasource_server, _DEFAULT_PLATFORM_DETAIL
         )
 
 
@@ -41,6 +41,8 @@ class IdentifierAccessor(AbstractIdentifierAccessor):
 
 @dataclass
 class DataAccessFunctionDetail:
+    __slots__ = ("arg_list", "data_access_function_name", "identifier_accessor")
+
     arg_list: Tree
     data_access_function_name: str
     identifier_accessor: Optional[IdentifierAccessor]
@@ -26,7 +26,11 @@ def get_lark_parser() -> Lark:
     return Lark(grammar, start="let_expression", regex=True)
 
 
+@functools.lru_cache(maxsize=512)
 def _parse_expression(expression: str) -> Tree:
+    # Many workspaces repeat identical autogenerated let/in expressions across
+    # tables; cache the Lark parse per unique expression. The returned Tree is
+    # shared between callers and must be treated as read-only.
     lark_parser: Lark = get_lark_parser()
 
     # Replace U+00a0 NO-BREAK SPACE with a normal space.
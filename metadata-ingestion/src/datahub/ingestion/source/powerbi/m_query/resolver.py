@@ -1,8 +1,22 @@
 import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from lark import Tree
 
@@ -22,9 +36,31 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
 
 logger = logging.getLogger(__name__)
 
+# Pre-resolved DataPlatformPair constants; SupportedDataPlatform.X.value goes
+# through the Enum descriptor on every access, these are plain attribute loads
+_POSTGRES_PAIR: DataPlatformPair = SupportedDataPlatform.POSTGRES_SQL.value
+_ORACLE_PAIR: DataPlatformPair = SupportedDataPlatform.ORACLE.value
+_SNOWFLAKE_PAIR: DataPlatformPair = SupportedDataPlatform.SNOWFLAKE.value
+_MS_SQL_PAIR: DataPlatformPair = SupportedDataPlatform.MS_SQL.value
+_DATABRICK_PAIR: DataPlatformPair = SupportedDataPlatform.DATABRICK_SQL.value
+_GOOGLE_BIGQUERY_PAIR: DataPlatformPair = SupportedDataPlatform.GOOGLE_BIGQUERY.value
+_AMAZON_REDSHIFT_PAIR: DataPlatformPair = SupportedDataPlatform.AMAZON_REDSHIFT.value
+
+
+@lru_cache(maxsize=1024)
+def _parse_native_query_tables(sql_query: str) -> Tuple[str, ...]:
+    # Workspaces often repeat identical boilerplate native queries across
+    # models; cache the full SQL parse per unique query. Tuple return keeps
+    # cache entries immutable.
+    return tuple(native_sql_parser.get_tables(sql_query))
+
 
 @dataclass
 class DataPlatformTable:
+    # __slots__ keeps per-instance memory low; large workspaces create one
+    # instance per upstream table
+    __slots__ = ("name", "full_name", "datasource_server", "data_platform_pair")
+
     name: str
     full_name: str
     datasource_server: str
@@ -32,6 +68,11 @@ class DataPlatformTable:
 
 
 class AbstractDataPlatformTableCreator(ABC):
+    def __init__(self) -> None:
+        # get_platform_pair is invariant per creator (NativeQuery overrides it
+        # per query and bypasses this cache); hoist it out of the hot paths
+        self._platform_pair: DataPlatformPair = self.get_platform_pair()
+
     @abstractmethod
     def create_dataplatform_tables(
         self, data_access_func_detail: DataAccessFunctionDetail
@@ -46,14 +87,10 @@ class AbstractDataPlatformTableCreator(ABC):
     def get_db_detail_from_argument(
         arg_list: Tree,
     ) -> Tuple[Optional[str], Optional[str]]:
-        arguments: List[str] = tree_function.strip_char_from_list(
-            values=tree_function.remove_whitespaces_from_list(
-                tree_function.token_values(arg_list)
-            ),
-        )
+        arguments: List[str] = tree_function.clean_token_values(arg_list)
 
         if len(arguments) < 2:
-            logger.debug(f"Expected minimum 2 arguments, but got {len(arguments)}")
+            logger.debug("Expected minimum 2 arguments, but got %d", len(arguments))
             return None, None
 
         return arguments[0], arguments[1]
@@ -64,7 +101,7 @@ class AbstractDataAccessMQueryResolver(ABC):
     parse_tree: Tree
     parameters: Dict[str, str]
     reporter: PowerBiDashboardSourceReport
-    data_access_functions: List[str]
+    data_access_functions: FrozenSet[str]
 
     def __init__(
         self,
@@ -77,7 +114,22 @@ class AbstractDataAccessMQueryResolver(ABC):
         self.parse_tree = parse_tree
         self.reporter = reporter
         self.parameters = parameters
-        self.data_access_functions = SupportedResolver.get_function_names()
+        # frozenset gives O(1) membership on the hottest branch of the traversal
+        self.data_access_functions = _FUNCTION_NAME_SET
+        # Cache of variable-statement lookups to avoid re-scanning the parse tree
+        # for the same identifier (e.g. branches of Table.Combine({t1,t2,...}))
+        self._variable_statement_cache: Dict[str, Optional[Tree]] = {}
+        # Cache of make_function_name results keyed by subtree id, so repeated
+        # invocations of the same function node are flattened only once
+        self._function_name_cache: Dict[int, str] = {}
+
+    def get_variable_statement(self, identifier: str) -> Optional[Tree]:
+        if identifier not in self._variable_statement_cache:
+            self._variable_statement_cache[
+                identifier
+            ] = tree_function.get_variable_statement(self.parse_tree, identifier)
+
+        return self._variable_statement_cache[identifier]
 
     @abstractmethod
     def resolve_to_data_platform_table_list(self) -> List[DataPlatformTable]:
@@ -94,7 +146,8 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
         )
         if item_selector is None:
             logger.debug("Item Selector not found in tree")
-            logger.debug(expression_tree.pretty())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(expression_tree.pretty())
             return None, None
 
         identifier_tree: Optional[Tree] = tree_function.first_identifier_func(
@@ -102,16 +155,13 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
         )
         if identifier_tree is None:
             logger.debug("Identifier not found in tree")
-            logger.debug(item_selector.pretty())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(item_selector.pretty())
             return None, None
 
         # remove whitespaces and quotes from token
-        tokens: List[str] = tree_function.strip_char_from_list(
-            tree_function.remove_whitespaces_from_list(
-                tree_function.token_values(
-                    cast(Tree, item_selector), parameters=self.parameters
-                )
-            ),
+        tokens: List[str] = tree_function.clean_token_values(
+            cast(Tree, item_selector), parameters=self.parameters
         )
         identifier: List[str] = tree_function.token_values(
             cast(Tree, identifier_tree)
@@ -137,7 +187,12 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
         self, invoke_expression: Tree
     ) -> Union[DataAccessFunctionDetail, List[str], None]:
         letter_tree: Tree = invoke_expression.children[0]
-        data_access_func: str = tree_function.make_function_name(letter_tree)
+        tree_id: int = id(letter_tree)
+        data_access_func: Optional[str] = self._function_name_cache.get(tree_id)
+        if data_access_func is None:
+            # Interning makes later registry lookups an identity comparison
+            data_access_func = sys.intern(tree_function.make_function_name(letter_tree))
+            self._function_name_cache[tree_id] = data_access_func
         # The invoke function is either DataAccess function like PostgreSQL.Database(<argument-list>) or
         # some other function like Table.AddColumn or Table.Combine and so on
         if data_access_func in self.data_access_functions:
@@ -163,9 +218,11 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
         )
 
         if first_arg_tree is None:
-            logger.debug(
-                f"Function invocation without argument in expression = {invoke_expression.pretty()}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Function invocation without argument in expression = %s",
+                    invoke_expression.pretty(),
+                )
             self.reporter.report_warning(
                 f"{self.table.full_name}-variable-statement",
                 "Function invocation without argument",
@@ -182,16 +239,19 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
             first_argument
         )
 
-        if TRACE_POWERBI_MQUERY_PARSER:
-            logger.debug(f"Extracting token from tree {first_argument.pretty()}")
-        else:
-            logger.debug(f"Extracting token from tree {first_argument}")
+        if logger.isEnabledFor(logging.DEBUG):
+            if TRACE_POWERBI_MQUERY_PARSER:
+                logger.debug("Extracting token from tree %s", first_argument.pretty())
+            else:
+                logger.debug("Extracting token from tree %s", first_argument)
         if expression is None:
             expression = tree_function.first_type_expression_func(first_argument)
             if expression is None:
-                logger.debug(
-                    f"Either list_expression or type_expression is not found = {invoke_expression.pretty()}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Either list_expression or type_expression is not found = %s",
+                        invoke_expression.pretty(),
+                    )
                 self.reporter.report_warning(
                     f"{self.table.full_name}-variable-statement",
                     "Function argument expression is not supported",
@@ -202,7 +262,7 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
             tree_function.token_values(expression)
         )
 
-        logger.debug(f"Tokens in invoke expression are {tokens}")
+        logger.debug("Tokens in invoke expression are %s", tokens)
         return tokens
 
     def _process_item_selector_expression(
@@ -235,45 +295,56 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
     def create_data_access_functional_detail(
         self, identifier: str
     ) -> List[DataAccessFunctionDetail]:
+        """
+        1) Find statement where identifier appear in the left-hand side i.e. identifier  = expression
+        2) Check expression is function invocation i.e. invoke_expression or item_selector
+        3) if it is function invocation and this function is not the data-access function then take first argument
+           i.e. identifier and push it on the worklist
+        4) if it is item_selector then take identifier and key-value pair,
+           add identifier and key-value pair in current_selector and push it on the worklist
+        5) This traversal will continue till we reach to data-access function and during traversal we will fill
+           token_dict dictionary for all item_selector we find.
+
+        The traversal uses an explicit stack instead of recursion to avoid
+        Python call-frame overhead and recursion-depth limits on deeply
+        chained variable statements.
+
+        :param identifier: variable to look for
+        :return: list of data-access function details
+        """
         table_links: List[DataAccessFunctionDetail] = []
+        # Each entry is (identifier, identifier_accessor) still to process
+        work_stack: List[Tuple[str, Optional[IdentifierAccessor]]] = [
+            (identifier, None)
+        ]
+        # Bind the bound methods once; this is the tightest loop of the parser
+        push = work_stack.append
+        pop = work_stack.pop
+        add_table_link = table_links.append
+
+        while work_stack:
+            current_identifier, identifier_accessor = pop()
 
-        def internal(
-            current_identifier: str,
-            identifier_accessor: Optional[IdentifierAccessor],
-        ) -> None:
-            """
-            1) Find statement where identifier appear in the left-hand side i.e. identifier  = expression
-            2) Check expression is function invocation i.e. invoke_expression or item_selector
-            3) if it is function invocation and this function is not the data-access function then take first argument
-               i.e. identifier and call the function recursively
-            4) if it is item_selector then take identifier and key-value pair,
-               add identifier and key-value pair in current_selector and call the function recursively
-            5) This recursion will continue till we reach to data-access function and during recursion we will fill
-               token_dict dictionary for all item_selector we find during traversal.
-
-            :param current_identifier: variable to look for
-            :param identifier_accessor:
-            :return: None
-            """
             # Grammar of variable_statement is <variable-name> = <expression>
             # Examples: Source = PostgreSql.Database(<arg-list>)
             #           public_order_date = Source{[Schema="public",Item="order_date"]}[Data]
-            v_statement: Optional[Tree] = tree_function.get_variable_statement(
-                self.parse_tree, current_identifier
+            v_statement: Optional[Tree] = self.get_variable_statement(
+                current_identifier
             )
             if v_statement is None:
                 self.reporter.report_warning(
                     f"{self.table.full_name}-variable-statement",
                     f"output variable ({current_identifier}) statement not found in table expression",
                 )
-                return None
+                continue
 
             # Any expression after "=" sign of variable-statement
             rh_tree: Optional[Tree] = tree_function.first_expression_func(v_statement)
             if rh_tree is None:
                 logger.debug("Expression tree not found")
-                logger.debug(v_statement.pretty())
-                return None
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(v_statement.pretty())
+                continue
 
             invoke_expression: Optional[
                 Tree
@@ -284,20 +355,18 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
                     DataAccessFunctionDetail, List[str], None
                 ] = self._process_invoke_expression(invoke_expression)
                 if result is None:
-                    return None  # No need to process some un-expected grammar found while processing invoke_expression
+                    continue  # No need to process some un-expected grammar found while processing invoke_expression
                 if isinstance(result, DataAccessFunctionDetail):
                     result.identifier_accessor = identifier_accessor
-                    table_links.append(result)  # Link of a table is completed
-                    identifier_accessor = (
-                        None  # reset the identifier_accessor for other table
-                    )
-                    return None
+                    add_table_link(result)  # Link of a table is completed
+                    continue
                 # Process first argument of the function.
                 # The first argument can be a single table argument or list of table.
                 # For example Table.Combine({t1,t2},....), here first argument is list of table.
                 # Table.AddColumn(t1,....), here first argument is single table.
-                for token in cast(List[str], result):
-                    internal(token, identifier_accessor)
+                # Push in reverse so tokens get processed in source order.
+                for token in reversed(cast(List[str], result)):
+                    push((token, identifier_accessor))
 
             else:
                 new_identifier, key_vs_value = self._process_item_selector_expression(
@@ -305,22 +374,23 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
                 )
                 if new_identifier is None or key_vs_value is None:
                     logger.debug("Required information not found in rh_tree")
-                    return None
+                    continue
                 new_identifier_accessor: IdentifierAccessor = (
                     self._create_or_update_identifier_accessor(
                         identifier_accessor, new_identifier, key_vs_value
                     )
                 )
 
-                return internal(new_identifier, new_identifier_accessor)
-
-        internal(identifier, None)
+                push((new_identifier, new_identifier_accessor))
 
         return table_links
 
     def resolve_to_data_platform_table_list(self) -> List[DataPlatformTable]:
         data_platform_tables: List[DataPlatformTable] = []
 
+        # id()-keyed cache is only valid while this parse tree is alive
+        self._function_name_cache.clear()
+
         output_variable: Optional[str] = tree_function.get_output_variable(
             self.parse_tree
         )
@@ -336,14 +406,16 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
             DataAccessFunctionDetail
         ] = self.create_data_access_functional_detail(output_variable)
 
-        # Each item is data-access function
+        # Each item is data-access function; one dict probe dispatches straight
+        # to the shared creator instance
         for f_detail in table_links:
-            supported_resolver = SupportedResolver.get_resolver(
-                f_detail.data_access_function_name
-            )
-            if supported_resolver is None:
+            table_full_name_creator: Optional[
+                AbstractDataPlatformTableCreator
+            ] = _SHARED_CREATOR_INSTANCES.get(f_detail.data_access_function_name)
+            if table_full_name_creator is None:
                 logger.debug(
-                    f"Resolver not found for the data-access-function {f_detail.data_access_function_name}"
+                    "Resolver not found for the data-access-function %s",
+                    f_detail.data_access_function_name,
                 )
                 self.reporter.report_warning(
                     f"{self.table.full_name}-data-access-function",
@@ -351,10 +423,6 @@ class MQueryResolver(AbstractDataAccessMQueryResolver, ABC):
                 )
                 continue
 
-            table_full_name_creator: AbstractDataPlatformTableCreator = (
-                supported_resolver.get_table_full_name_creator()()
-            )
-
             data_platform_tables.extend(
                 table_full_name_creator.create_dataplatform_tables(f_detail)
             )
@@ -376,7 +444,9 @@ class DefaultTwoStepDataAccessSources(AbstractDataPlatformTableCreator, ABC):
         self, data_access_func_detail: DataAccessFunctionDetail
     ) -> List[DataPlatformTable]:
         logger.debug(
-            f"Processing {self.get_platform_pair().powerbi_data_platform_name} data-access function detail {data_access_func_detail}"
+            "Processing %s data-access function detail %s",
+            self._platform_pair.powerbi_data_platform_name,
+            data_access_func_detail,
         )
 
         server, db_name = self.get_db_detail_from_argument(
@@ -385,18 +455,18 @@ class DefaultTwoStepDataAccessSources(AbstractDataPlatformTableCreator, ABC):
         if server is None or db_name is None:
             return []  # Return empty list
 
-        schema_name: str = cast(
+        identifier_accessor: IdentifierAccessor = cast(
             IdentifierAccessor, data_access_func_detail.identifier_accessor
-        ).items["Schema"]
-
-        table_name: str = cast(
-            IdentifierAccessor, data_access_func_detail.identifier_accessor
-        ).items["Item"]
+        )
+        schema_name: str = identifier_accessor.items["Schema"]
+        table_name: str = identifier_accessor.items["Item"]
 
         full_table_name: str = f"{db_name}.{schema_name}.{table_name}"
 
         logger.debug(
-            f"Platform({self.get_platform_pair().datahub_data_platform_name}) full_table_name= {full_table_name}"
+            "Platform(%s) full_table_name= %s",
+            self._platform_pair.datahub_data_platform_name,
+            full_table_name,
         )
 
         return [
@@ -404,7 +474,7 @@ class DefaultTwoStepDataAccessSources(AbstractDataPlatformTableCreator, ABC):
                 name=table_name,
                 full_name=full_table_name,
                 datasource_server=server,
-                data_platform_pair=self.get_platform_pair(),
+                data_platform_pair=self._platform_pair,
             )
         ]
 
@@ -416,21 +486,19 @@ class PostgresDataPlatformTableCreator(DefaultTwoStepDataAccessSources):
         return self.two_level_access_pattern(data_access_func_detail)
 
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.POSTGRES_SQL.value
+        return _POSTGRES_PAIR
 
 
 class MSSqlDataPlatformTableCreator(DefaultTwoStepDataAccessSources):
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.MS_SQL.value
+        return _MS_SQL_PAIR
 
     def create_dataplatform_tables(
         self, data_access_func_detail: DataAccessFunctionDetail
     ) -> List[DataPlatformTable]:
         dataplatform_tables: List[DataPlatformTable] = []
-        arguments: List[str] = tree_function.strip_char_from_list(
-            values=tree_function.remove_whitespaces_from_list(
-                tree_function.token_values(data_access_func_detail.arg_list)
-            ),
+        arguments: List[str] = tree_function.clean_token_values(
+            data_access_func_detail.arg_list
         )
 
         if len(arguments) == 2:
@@ -444,20 +512,21 @@ class MSSqlDataPlatformTableCreator(DefaultTwoStepDataAccessSources):
 
         db_name: str = arguments[1]
 
-        tables: List[str] = native_sql_parser.get_tables(arguments[3])
+        tables: Tuple[str, ...] = _parse_native_query_tables(arguments[3])
         for table in tables:
-            schema_and_table: List[str] = table.split(".")
-            if len(schema_and_table) == 1:
-                # schema name is not present. Default schema name in MS-SQL is dbo
-                # https://learn.microsoft.com/en-us/sql/relational-databases/security/authentication-access/ownership-and-user-schema-separation?view=sql-server-ver16
-                schema_and_table.insert(0, "dbo")
+            parts: List[str] = table.rsplit(".", 1)
+            # If the schema name is not present, default it to dbo (the MS-SQL default schema)
+            # https://learn.microsoft.com/en-us/sql/relational-databases/security/authentication-access/ownership-and-user-schema-separation?view=sql-server-ver16
+            schema_name, table_name = (
+                (parts[0], parts[1]) if len(parts) == 2 else ("dbo", parts[0])
+            )
 
             dataplatform_tables.append(
                 DataPlatformTable(
-                    name=schema_and_table[1],
-                    full_name=f"{db_name}.{schema_and_table[0]}.{schema_and_table[1]}",
+                    name=table_name,
+                    full_name=f"{db_name}.{schema_name}.{table_name}",
                     datasource_server=arguments[0],
-                    data_platform_pair=self.get_platform_pair(),
+                    data_platform_pair=self._platform_pair,
                 )
             )
 
@@ -468,7 +537,7 @@ class MSSqlDataPlatformTableCreator(DefaultTwoStepDataAccessSources):
 
 class OracleDataPlatformTableCreator(AbstractDataPlatformTableCreator):
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.ORACLE.value
+        return _ORACLE_PAIR
 
     @staticmethod
     def _get_server_and_db_name(value: str) -> Tuple[Optional[str], Optional[str]]:
@@ -489,7 +558,7 @@ class OracleDataPlatformTableCreator(AbstractDataPlatformTableCreator):
         self, data_access_func_detail: DataAccessFunctionDetail
     ) -> List[DataPlatformTable]:
         logger.debug(
-            f"Processing Oracle data-access function detail {data_access_func_detail}"
+            "Processing Oracle data-access function detail %s", data_access_func_detail
         )
 
         arguments: List[str] = tree_function.remove_whitespaces_from_list(
@@ -501,21 +570,18 @@ class OracleDataPlatformTableCreator(AbstractDataPlatformTableCreator):
         if db_name is None or server is None:
             return []
 
-        schema_name: str = cast(
+        schema_accessor: IdentifierAccessor = cast(
             IdentifierAccessor, data_access_func_detail.identifier_accessor
-        ).items["Schema"]
-
-        table_name: str = cast(
-            IdentifierAccessor,
-            cast(IdentifierAccessor, data_access_func_detail.identifier_accessor).next,
-        ).items["Name"]
+        )
+        schema_name: str = schema_accessor.items["Schema"]
+        table_name: str = cast(IdentifierAccessor, schema_accessor.next).items["Name"]
 
         return [
             DataPlatformTable(
                 name=table_name,
                 full_name=f"{db_name}.{schema_name}.{table_name}",
                 datasource_server=server,
-                data_platform_pair=self.get_platform_pair(),
+                data_platform_pair=self._platform_pair,
             )
         ]
 
@@ -525,24 +591,22 @@ class DatabrickDataPlatformTableCreator(AbstractDataPlatformTableCreator):
         self, data_access_func_detail: DataAccessFunctionDetail
     ) -> List[DataPlatformTable]:
         logger.debug(
-            f"Processing Databrick data-access function detail {data_access_func_detail}"
+            "Processing Databrick data-access function detail %s",
+            data_access_func_detail,
         )
-        value_dict = {}
+        value_dict: Dict[str, str] = {}
         temp_accessor: Optional[
             Union[IdentifierAccessor, AbstractIdentifierAccessor]
         ] = data_access_func_detail.identifier_accessor
-        while temp_accessor:
-            if isinstance(temp_accessor, IdentifierAccessor):
-                value_dict[temp_accessor.items["Kind"]] = temp_accessor.items["Name"]
-                if temp_accessor.next is not None:
-                    temp_accessor = temp_accessor.next
-                else:
-                    break
-            else:
+        while temp_accessor is not None:
+            if not isinstance(temp_accessor, IdentifierAccessor):
                 logger.debug(
                     "expecting instance to be IdentifierAccessor, please check if parsing is done properly"
                 )
                 return []
+            items = temp_accessor.items
+            value_dict[items["Kind"]] = items["Name"]
+            temp_accessor = temp_accessor.next
 
         db_name: str = value_dict["Database"]
         schema_name: str = value_dict["Schema"]
@@ -554,12 +618,12 @@ class DatabrickDataPlatformTableCreator(AbstractDataPlatformTableCreator):
                 name=table_name,
                 full_name=f"{db_name}.{schema_name}.{table_name}",
                 datasource_server=server if server else "",
-                data_platform_pair=self.get_platform_pair(),
+                data_platform_pair=self._platform_pair,
             )
         ]
 
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.DATABRICK_SQL.value
+        return _DATABRICK_PAIR
 
 
 class DefaultThreeStepDataAccessSources(AbstractDataPlatformTableCreator, ABC):
@@ -572,27 +636,35 @@ class DefaultThreeStepDataAccessSources(AbstractDataPlatformTableCreator, ABC):
         self, data_access_func_detail: DataAccessFunctionDetail
     ) -> List[DataPlatformTable]:
         logger.debug(
-            f"Processing {self.get_platform_pair().datahub_data_platform_name} function detail {data_access_func_detail}"
+            "Processing %s function detail %s",
+            self._platform_pair.datahub_data_platform_name,
+            data_access_func_detail,
         )
 
         arguments: List[str] = tree_function.remove_whitespaces_from_list(
             tree_function.token_values(data_access_func_detail.arg_list)
         )
+        # Walk Database -> Schema -> Table in a single forward pass
+        db_accessor: IdentifierAccessor = cast(
+            IdentifierAccessor, data_access_func_detail.identifier_accessor
+        )
+        schema_accessor: IdentifierAccessor = cast(IdentifierAccessor, db_accessor.next)
+        table_accessor: IdentifierAccessor = cast(
+            IdentifierAccessor, schema_accessor.next
+        )
         # First is database name
-        db_name: str = data_access_func_detail.identifier_accessor.items["Name"]  # type: ignore
+        db_name: str = db_accessor.items["Name"]
         # Second is schema name
-        schema_name: str = cast(
-            IdentifierAccessor, data_access_func_detail.identifier_accessor.next  # type: ignore
-        ).items["Name"]
+        schema_name: str = schema_accessor.items["Name"]
         # Third is table name
-        table_name: str = cast(
-            IdentifierAccessor, data_access_func_detail.identifier_accessor.next.next  # type: ignore
-        ).items["Name"]
+        table_name: str = table_accessor.items["Name"]
 
         full_table_name: str = f"{db_name}.{schema_name}.{table_name}"
 
         logger.debug(
-            f"{self.get_platform_pair().datahub_data_platform_name} full-table-name {full_table_name}"
+            "%s full-table-name %s",
+            self._platform_pair.datahub_data_platform_name,
+            full_table_name,
         )
 
         return [
@@ -602,19 +674,19 @@ class DefaultThreeStepDataAccessSources(AbstractDataPlatformTableCreator, ABC):
                 datasource_server=self.get_datasource_server(
                     arguments, data_access_func_detail
                 ),
-                data_platform_pair=self.get_platform_pair(),
+                data_platform_pair=self._platform_pair,
             )
         ]
 
 
 class SnowflakeDataPlatformTableCreator(DefaultThreeStepDataAccessSources):
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.SNOWFLAKE.value
+        return _SNOWFLAKE_PAIR
 
 
 class GoogleBigQueryDataPlatformTableCreator(DefaultThreeStepDataAccessSources):
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.GOOGLE_BIGQUERY.value
+        return _GOOGLE_BIGQUERY_PAIR
 
     def get_datasource_server(
         self, arguments: List[str], data_access_func_detail: DataAccessFunctionDetail
@@ -630,13 +702,14 @@ class GoogleBigQueryDataPlatformTableCreator(DefaultThreeStepDataAccessSources):
 
 class AmazonRedshiftDataPlatformTableCreator(AbstractDataPlatformTableCreator):
     def get_platform_pair(self) -> DataPlatformPair:
-        return SupportedDataPlatform.AMAZON_REDSHIFT.value
+        return _AMAZON_REDSHIFT_PAIR
 
     def create_dataplatform_tables(
         self, data_access_func_detail: DataAccessFunctionDetail
     ) -> List[DataPlatformTable]:
         logger.debug(
-            f"Processing AmazonRedshift data-access function detail {data_access_func_detail}"
+            "Processing AmazonRedshift data-access function detail %s",
+            data_access_func_detail,
         )
 
         server, db_name = self.get_db_detail_from_argument(
@@ -645,34 +718,32 @@ class AmazonRedshiftDataPlatformTableCreator(AbstractDataPlatformTableCreator):
         if db_name is None or server is None:
             return []  # Return empty list
 
-        schema_name: str = cast(
+        schema_accessor: IdentifierAccessor = cast(
             IdentifierAccessor, data_access_func_detail.identifier_accessor
-        ).items["Name"]
-
-        table_name: str = cast(
-            IdentifierAccessor,
-            cast(IdentifierAccessor, data_access_func_detail.identifier_accessor).next,
-        ).items["Name"]
+        )
+        schema_name: str = schema_accessor.items["Name"]
+        table_name: str = cast(IdentifierAccessor, schema_accessor.next).items["Name"]
 
         return [
             DataPlatformTable(
                 name=table_name,
                 full_name=f"{db_name}.{schema_name}.{table_name}",
                 datasource_server=server,
-                data_platform_pair=self.get_platform_pair(),
+                data_platform_pair=self._platform_pair,
             )
         ]
 
 
 class NativeQueryDataPlatformTableCreator(AbstractDataPlatformTableCreator):
     SUPPORTED_NATIVE_QUERY_DATA_PLATFORM: dict = {
-        SupportedDataPlatform.SNOWFLAKE.value.powerbi_data_platform_name: SupportedDataPlatform.SNOWFLAKE,
-        SupportedDataPlatform.AMAZON_REDSHIFT.value.powerbi_data_platform_name: SupportedDataPlatform.AMAZON_REDSHIFT,
+        _SNOWFLAKE_PAIR.powerbi_data_platform_name: SupportedDataPlatform.SNOWFLAKE,
+        _AMAZON_REDSHIFT_PAIR.powerbi_data_platform_name: SupportedDataPlatform.AMAZON_REDSHIFT,
     }
-    current_data_platform: SupportedDataPlatform = SupportedDataPlatform.SNOWFLAKE
 
     def get_platform_pair(self) -> DataPlatformPair:
-        return self.current_data_platform.value
+        # Only a default; the actual platform is resolved per query inside
+        # create_dataplatform_tables and passed to DataPlatformTable directly
+        return _SNOWFLAKE_PAIR
 
     @staticmethod
     def is_native_parsing_supported(data_access_function_name: str) -> bool:
@@ -692,9 +763,10 @@ class NativeQueryDataPlatformTableCreator(AbstractDataPlatformTableCreator):
 
         if len(flat_argument_list) != 2:
             logger.debug(
-                f"Expecting 2 argument, actual argument count is {len(flat_argument_list)}"
+                "Expecting 2 argument, actual argument count is %d",
+                len(flat_argument_list),
             )
-            logger.debug(f"Flat argument list = {flat_argument_list}")
+            logger.debug("Flat argument list = %s", flat_argument_list)
             return dataplatform_tables
         data_access_tokens: List[str] = tree_function.remove_whitespaces_from_list(
             tree_function.token_values(flat_argument_list[0])
@@ -702,46 +774,50 @@ class NativeQueryDataPlatformTableCreator(AbstractDataPlatformTableCreator):
 
         if not self.is_native_parsing_supported(data_access_tokens[0]):
             logger.debug(
-                f"Unsupported native-query data-platform = {data_access_tokens[0]}"
+                "Unsupported native-query data-platform = %s", data_access_tokens[0]
             )
             logger.debug(
-                f"NativeQuery is supported only for {self.SUPPORTED_NATIVE_QUERY_DATA_PLATFORM}"
+                "NativeQuery is supported only for %s",
+                self.SUPPORTED_NATIVE_QUERY_DATA_PLATFORM,
             )
 
         if len(data_access_tokens[0]) < 3:
             logger.debug(
-                f"Server is not available in argument list for data-platform {data_access_tokens[0]}. Returning empty "
-                "list"
+                "Server is not available in argument list for data-platform %s. "
+                "Returning empty list",
+                data_access_tokens[0],
             )
             return dataplatform_tables
 
-        self.current_data_platform = self.SUPPORTED_NATIVE_QUERY_DATA_PLATFORM[
-            data_access_tokens[0]
-        ]
+        # Keep the platform in a local so the creator instance stays stateless
+        # and shareable across tables (and threads)
+        data_platform_pair: DataPlatformPair = (
+            self.SUPPORTED_NATIVE_QUERY_DATA_PLATFORM[data_access_tokens[0]].value
+        )
         # First argument is the query
-        sql_query: str = tree_function.strip_char_from_list(
-            values=tree_function.remove_whitespaces_from_list(
-                tree_function.token_values(flat_argument_list[1])
-            ),
-        )[
+        sql_query: str = tree_function.clean_token_values(flat_argument_list[1])[
             0
         ]  # Remove any whitespaces and double quotes character
 
-        for table in native_sql_parser.get_tables(sql_query):
-            if len(table.split(".")) != 3:
+        # Server token is loop-invariant; strip it once
+        server: str = tree_function.strip_char_from_list([data_access_tokens[2]])[0]
+
+        for table in _parse_native_query_tables(sql_query):
+            # Exactly db.schema.table; count() keeps the single-pass check
+            # without materializing an unbounded split
+            if table.count(".") != 2:
                 logger.debug(
-                    f"Skipping table {table} as it is not as per full_table_name format"
+                    "Skipping table %s as it is not as per full_table_name format",
+                    table,
                 )
                 continue
 
             dataplatform_tables.append(
                 DataPlatformTable(
-                    name=table.split(".")[2],
+                    name=table.rsplit(".", 1)[1],
                     full_name=table,
-                    datasource_server=tree_function.strip_char_from_list(
-                        [data_access_tokens[2]]
-                    )[0],
-                    data_platform_pair=self.get_platform_pair(),
+                    datasource_server=server,
+                    data_platform_pair=data_platform_pair,
                 )
             )
 
@@ -800,25 +876,64 @@ class SupportedResolver(Enum):
         FunctionName.NATIVE_QUERY,
     )
 
+    def __init__(
+        self,
+        table_full_name_creator: Type[AbstractDataPlatformTableCreator],
+        function_name: FunctionName,
+    ) -> None:
+        # Resolve the tuple members once; get_function_name would otherwise
+        # walk self.value[1].value (two Enum descriptor lookups) per call
+        self._table_full_name_creator = table_full_name_creator
+        self._function_name = function_name.value
+
     def get_table_full_name_creator(self) -> Type[AbstractDataPlatformTableCreator]:
-        return self.value[0]
+        return self._table_full_name_creator
 
     def get_function_name(self) -> str:
-        return self.value[1].value
+        return self._function_name
 
     @staticmethod
-    def get_function_names() -> List[str]:
-        functions: List[str] = []
-        for supported_resolver in SupportedResolver:
-            functions.append(supported_resolver.get_function_name())
+    def get_function_names() -> Tuple[str, ...]:
+        return _FUNCTION_NAMES
 
-        return functions
+    @staticmethod
+    def is_supported_function(function_name: str) -> bool:
+        return function_name in _FUNCTION_NAME_SET
 
     @staticmethod
     def get_resolver(function_name: str) -> Optional["SupportedResolver"]:
-        logger.debug(f"Looking for resolver {function_name}")
-        for supported_resolver in SupportedResolver:
-            if function_name == supported_resolver.get_function_name():
-                return supported_resolver
-        logger.debug(f"Resolver not found for function_name {function_name}")
-        return None
+        # EAFP: the hit path does exactly one dict probe
+        try:
+            return _FUNCTION_NAME_TO_RESOLVER[function_name]
+        except KeyError:
+            logger.debug("Resolver not found for function_name %s", function_name)
+            return None
+
+
+# Plain read-only mapping avoids the Enum double-indirection (.value[1].value)
+# for every DataAccessFunctionDetail lookup; MappingProxyType keeps the
+# registry frozen after import while the enums remain the public API
+# Keys are interned so lookups with interned probes short-circuit on pointer
+# equality inside the dict machinery instead of comparing characters
+_FUNCTION_NAME_TO_RESOLVER: Mapping[str, SupportedResolver] = MappingProxyType(
+    {
+        sys.intern(supported_resolver.get_function_name()): supported_resolver
+        for supported_resolver in SupportedResolver
+    }
+)
+
+# Immutable views over the registry keys: tuple for enumeration, frozenset for
+# O(1) membership checks
+_FUNCTION_NAMES: Tuple[str, ...] = tuple(_FUNCTION_NAME_TO_RESOLVER)
+_FUNCTION_NAME_SET: FrozenSet[str] = frozenset(_FUNCTION_NAME_TO_RESOLVER)
+
+# Creators are stateless, so a single shared instance per class avoids an
+# allocation per data-access function.
+_SHARED_CREATOR_INSTANCES: Mapping[
+    str, AbstractDataPlatformTableCreator
+] = MappingProxyType(
+    {
+        function_name: supported_resolver.get_table_full_name_creator()()
+        for function_name, supported_resolver in _FUNCTION_NAME_TO_RESOLVER.items()
+    }
+)
@@ -18,11 +18,7 @@ def get_output_variable(root: Tree) -> Optional[str]:
     # Get list of terminal value
     # Remove any whitespaces
     # Remove any spaces
-    return "".join(
-        strip_char_from_list(
-            remove_whitespaces_from_list(token_values(in_expression_tree)), " "
-        )
-    )
+    return "".join(clean_token_values(in_expression_tree, char=" "))
 
 
 def get_variable_statement(parse_tree: Tree, variable: str) -> Optional[Tree]:
@@ -33,13 +29,13 @@ def get_variable_statement(parse_tree: Tree, variable: str) -> Optional[Tree]:
         values: List[str] = token_values(tree.children[0])
         actual_value: str = "".join(strip_char_from_list(values, " "))
         if TRACE_POWERBI_MQUERY_PARSER:
-            logger.debug(f"Actual Value = {actual_value}")
-            logger.debug(f"Expected Value = {variable}")
+            logger.debug("Actual Value = %s", actual_value)
+            logger.debug("Expected Value = %s", variable)
 
         if actual_value.lower() == variable.lower():
             return tree
 
-    logger.debug(f"Provided variable({variable}) not found in variable rule")
+    logger.debug("Provided variable(%s) not found in variable rule", variable)
 
     return None
 
@@ -96,7 +92,7 @@ def token_values(tree: Tree, parameters: Dict[str, str] = {}) -> List[str]:
                 values.append(resolved)
             else:
                 # If we can't resolve, fall back to the name of the variable.
-                logger.debug(f"Unable to resolve parameter reference to {ref}")
+                logger.debug("Unable to resolve parameter reference to %s", ref)
                 values.append(ref)
         elif isinstance(node, Token):
             # This means we're probably looking at a literal.
@@ -128,6 +124,22 @@ def strip_char_from_list(values: List[str], char: str = '"') -> List[str]:
     return result
 
 
+def clean_token_values(
+    tree: Tree, parameters: Dict[str, str] = {}, char: str = '"'
+) -> List[str]:
+    """
+    Single-pass equivalent of
+    strip_char_from_list(remove_whitespaces_from_list(token_values(tree)))
+    avoiding the two intermediate list allocations on the hot parsing path.
+    """
+    result: List[str] = []
+    for item in token_values(tree, parameters=parameters):
+        if item.strip() not in ("", "\n", "\t"):
+            result.append(item.strip(char))
+
+    return result
+
+
 def make_function_name(tree: Tree) -> str:
     values: List[str] = token_values(tree)
     return ".".join(values)
@@ -145,8 +157,8 @@ def get_all_function_name(tree: Tree) -> List[str]:
     _filter: Any = tree.find_data("invoke_expression")
 
     for node in _filter:
-        if TRACE_POWERBI_MQUERY_PARSER:
-            logger.debug(f"Tree = {node.pretty()}")
+        if TRACE_POWERBI_MQUERY_PARSER and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tree = %s", node.pretty())
         primary_expression_node: Optional[Tree] = first_primary_expression_func(node)
         if primary_expression_node is None:
             continue
@@ -161,8 +173,14 @@ def get_all_function_name(tree: Tree) -> List[str]:
 
 
 def flat_argument_list(tree: Tree) -> List[Tree]:
-    values: List[Tree] = []
-
+    # The same argument-list node gets flattened from several call sites
+    # (invoke-expression processing and the NativeQuery creator); memoize the
+    # result on the node itself so repeat visits are a single attribute load.
+    values: Optional[List[Tree]] = getattr(tree, "_flat_argument_cache", None)
+    if values is not None:
+        return values
+
+    values = []
     for child in tree.children:
         if isinstance(child, Token):
             continue
@@ -171,6 +189,8 @@ def flat_argument_list(tree: Tree) -> List[Tree]:
         ):
             values.append(child)
 
+    tree._flat_argument_cache = values  # type: ignore[attr-defined]
+
     return values
 
 
@@ -3,8 +3,20 @@
 # Meta Data Ingestion From the Power BI Source
 #
 #########################################################
+import concurrent.futures
 import logging
-from typing import Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import datahub.emitter.mce_builder as builder
 import datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes as powerbi_data_classes
@@ -70,11 +82,19 @@ from datahub.metadata.schema_classes import (
     UpstreamLineageClass,
     ViewPropertiesClass,
 )
-from datahub.utilities.dedup_list import deduplicate_list
 
 # Logger instance
 logger = logging.getLogger(__name__)
 
+# Precompiled %s templates for the chart/dashboard key ids; %-interpolation
+# skips str.format's template parsing, which runs once per emitted key aspect
+_CHART_ID_FMT = Constant.CHART_ID.replace("{}", "%s")
+_DASHBOARD_ID_FMT = Constant.DASHBOARD_ID.replace("{}", "%s")
+
+# Default audit stamps are identical for every chart/dashboard info aspect;
+# nothing downstream mutates the instance, so one allocation is shared
+_EMPTY_AUDIT_STAMPS = ChangeAuditStamps()
+
 
 class Mapper:
     """
@@ -91,7 +111,9 @@ class Mapper:
             return self.id == instance.id
 
         def __hash__(self):
-            return id(self.id)
+            # Hash the id value, not the identity of the string object;
+            # otherwise equal ids hash differently and set-based dedup breaks
+            return hash(self.id)
 
     def __init__(
         self,
@@ -104,21 +126,50 @@ class Mapper:
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
         self.processed_datasets: Set[powerbi_data_classes.PowerBIDataset] = set()
         self.workspace_key: PlatformKey
-
-    @staticmethod
-    def urn_to_lowercase(value: str, flag: bool) -> str:
-        if flag is True:
-            return value.lower()
-
-        return value
-
-    def lineage_urn_to_lowercase(self, value):
-        return Mapper.urn_to_lowercase(
-            value, self.__config.convert_lineage_urns_to_lowercase
+        # Tiles of a dashboard frequently share datasets; remember resolved
+        # upstream tables so each (dataset, table) pair is parsed once
+        self._upstream_cache: Dict[Tuple, List[resolver.DataPlatformTable]] = {}
+        # Corp-user key MCPs already emitted in this run, so users shared
+        # across dashboards and reports are emitted once
+        self._emitted_user_urns: Set[str] = set()
+        # Evaluated once; these flags gate aspects appended for every entity
+        # of the workspace
+        self._extract_containers: bool = bool(
+            config.extract_workspaces_to_containers
+            or config.extract_datasets_to_containers
         )
-
-    def assets_urn_to_lowercase(self, value):
-        return Mapper.urn_to_lowercase(value, self.__config.convert_urns_to_lowercase)
+        self._extract_endorsements: bool = config.extract_endorsements_to_tags
+        # Case normalizers specialized once instead of re-checking the config
+        # flag per urn
+        self._asset_case: Callable[[str], str] = (
+            str.lower
+            if config.convert_urns_to_lowercase
+            else cast(Callable[[str], str], str)
+        )
+        self._lineage_case: Callable[[str], str] = (
+            str.lower
+            if config.convert_lineage_urns_to_lowercase
+            else cast(Callable[[str], str], str)
+        )
+        # Container aspects and browse paths are identical for every entity of
+        # a workspace (or dataset); compute each once
+        self._container_aspect_cache: Dict[str, ContainerClass] = {}
+        # Many tiles and reports of a workspace reference the same dataset;
+        # its MCPs (properties, status, lineage, container, tags) are
+        # identical, so generate them once per (workspace, dataset)
+        self._dataset_mcps_cache: Dict[
+            Tuple[str, str], List[MetadataChangeProposalWrapper]
+        ] = {}
+        self._browse_path_cache: Dict[str, BrowsePathsClass] = {}
+
+    def _workspace_browse_path(self, workspace_name: str) -> BrowsePathsClass:
+        browse_path = self._browse_path_cache.get(workspace_name)
+        if browse_path is None:
+            browse_path = BrowsePathsClass(
+                paths=[f"/{Constant.PLATFORM_NAME}/{workspace_name}"]
+            )
+            self._browse_path_cache[workspace_name] = browse_path
+        return browse_path
 
     def new_mcp(
         self,
@@ -143,11 +194,7 @@ class Mapper:
         self, mcp: MetadataChangeProposalWrapper
     ) -> EquableMetadataWorkUnit:
         return Mapper.EquableMetadataWorkUnit(
-            id="{PLATFORM}-{ENTITY_URN}-{ASPECT_NAME}".format(
-                PLATFORM=self.__config.platform_name,
-                ENTITY_URN=mcp.entityUrn,
-                ASPECT_NAME=mcp.aspectName,
-            ),
+            id=f"{self.__config.platform_name}-{mcp.entityUrn}-{mcp.aspectName}",
             mcp=mcp,
         )
 
@@ -163,25 +210,87 @@ class Mapper:
         )
         return [schema_mcp]
 
+    def resolve_upstream_tables(
+        self, tables: List[powerbi_data_classes.Table]
+    ) -> Dict[str, List[resolver.DataPlatformTable]]:
+        """
+        Resolve the upstream data-platform tables of each PowerBI table.
+        Resolutions are independent of each other, so run them concurrently;
+        results are memoized so repeat visits of a dataset's tables are free.
+        """
+
+        def cache_key(table: powerbi_data_classes.Table) -> Tuple:
+            parameters = table.dataset.parameters if table.dataset else {}
+            return (
+                table.dataset.id if table.dataset else None,
+                table.full_name,
+                tuple(sorted((parameters or {}).items())),
+            )
+
+        def resolve(
+            table: powerbi_data_classes.Table,
+        ) -> List[resolver.DataPlatformTable]:
+            # table.dataset should always be set, but we check it just in case.
+            parameters = table.dataset.parameters if table.dataset else {}
+            return parser.get_upstream_tables(
+                table, self.__reporter, parameters=parameters
+            )
+
+        result: Dict[str, List[resolver.DataPlatformTable]] = {}
+        pending: List[powerbi_data_classes.Table] = []
+        for table in tables:
+            cached = self._upstream_cache.get(cache_key(table))
+            if cached is not None:
+                result[table.full_name] = cached
+            else:
+                pending.append(table)
+
+        if len(pending) <= 1:  # not worth the pool overhead
+            resolved_lists = [resolve(table) for table in pending]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(pending))
+            ) as executor:
+                resolved_lists = list(executor.map(resolve, pending))
+
+        for table, resolved in zip(pending, resolved_lists):
+            self._upstream_cache[cache_key(table)] = resolved
+            result[table.full_name] = resolved
+
+        return result
+
     def extract_lineage(
-        self, table: powerbi_data_classes.Table, ds_urn: str
+        self,
+        table: powerbi_data_classes.Table,
+        ds_urn: str,
+        upstream_tables: Optional[List[resolver.DataPlatformTable]] = None,
     ) -> List[MetadataChangeProposalWrapper]:
-        mcps: List[MetadataChangeProposalWrapper] = []
+        # Without lineage extraction or any platform mapping no upstream can
+        # ever be emitted; skip the costly M-query resolution outright
+        if (
+            self.__config.extract_lineage is not True
+            or not self.__config.dataset_type_mapping
+        ):
+            return []
 
-        # table.dataset should always be set, but we check it just in case.
-        parameters = table.dataset.parameters if table.dataset else {}
+        mcps: List[MetadataChangeProposalWrapper] = []
 
         upstreams: List[UpstreamClass] = []
-        upstream_tables: List[resolver.DataPlatformTable] = parser.get_upstream_tables(
-            table, self.__reporter, parameters=parameters
-        )
+        if upstream_tables is None:
+            upstream_tables = self.resolve_upstream_tables([table])[table.full_name]
         logger.debug(
             f"PowerBI virtual table {table.full_name} and it's upstream dataplatform tables = {upstream_tables}"
         )
+        dataset_type_mapping = self.__config.dataset_type_mapping
+        # Bound once; the urn builder is called for every upstream table
+        _make_dataset_urn = builder.make_dataset_urn_with_platform_instance
+        seen_urns: Set[str] = set()
         for upstream_table in upstream_tables:
+            # Membership check directly on the dict; .keys() would allocate a
+            # fresh view per iteration
             if (
                 upstream_table.data_platform_pair.powerbi_data_platform_name
-                not in self.__config.dataset_type_mapping.keys()
+                not in dataset_type_mapping
             ):
                 logger.debug(
                     f"Skipping upstream table for {ds_urn}. The platform {upstream_table.data_platform_pair.powerbi_data_platform_name} is not part of dataset_type_mapping",
@@ -193,13 +302,19 @@ class Mapper:
                     upstream_table
                 )
             )
-            upstream_urn = builder.make_dataset_urn_with_platform_instance(
+            upstream_urn = _make_dataset_urn(
                 platform=upstream_table.data_platform_pair.datahub_data_platform_name,
                 platform_instance=platform_detail.platform_instance,
                 env=platform_detail.env,
-                name=self.lineage_urn_to_lowercase(upstream_table.full_name),
+                name=self._lineage_case(upstream_table.full_name),
             )
 
+            # The same source table can be reached through several M-query
+            # steps; emit each upstream only once
+            if upstream_urn in seen_urns:
+                continue
+            seen_urns.add(upstream_urn)
+
             upstream_table_class = UpstreamClass(
                 upstream_urn,
                 DatasetLineageTypeClass.TRANSFORMED,
@@ -294,6 +409,12 @@ class Mapper:
         dataset_mcps: List[MetadataChangeProposalWrapper] = []
         if dataset is None:
             return dataset_mcps
+
+        cache_key = (workspace.id, dataset.id)
+        cached_mcps = self._dataset_mcps_cache.get(cache_key)
+        if cached_mcps is not None:
+            return cached_mcps
+
         if not any(
             [
                 self.__config.filter_dataset_endorsements.allowed(tag)
@@ -303,18 +424,28 @@ class Mapper:
             logger.debug(
                 "Returning empty dataset_mcps as no dataset tag matched with filter_dataset_endorsements"
             )
+            self._dataset_mcps_cache[cache_key] = dataset_mcps
             return dataset_mcps
 
         logger.debug(
             f"Mapping dataset={dataset.name}(id={dataset.id}) to datahub dataset"
         )
 
+        upstream_tables_by_name: Dict[str, List[resolver.DataPlatformTable]] = {}
+        extract_lineage = self.__config.extract_lineage is True and bool(
+            self.__config.dataset_type_mapping
+        )
+        if extract_lineage:
+            upstream_tables_by_name = self.resolve_upstream_tables(dataset.tables)
+
+        # Bound once; the urn builder is called for every table
+        _make_dataset_urn = builder.make_dataset_urn_with_platform_instance
         for table in dataset.tables:
             self.processed_datasets.add(dataset)
             # Create a URN for dataset
-            ds_urn = builder.make_dataset_urn_with_platform_instance(
+            ds_urn = _make_dataset_urn(
                 platform=self.__config.platform_name,
-                name=self.assets_urn_to_lowercase(table.full_name),
+                name=self._asset_case(table.full_name),
                 platform_instance=self.__config.platform_instance,
                 env=self.__config.env,
             )
@@ -392,8 +523,12 @@ class Mapper:
 
             dataset_mcps.extend([info_mcp, status_mcp, subtype_mcp])
 
-            if self.__config.extract_lineage is True:
-                dataset_mcps.extend(self.extract_lineage(table, ds_urn))
+            if extract_lineage:
+                dataset_mcps.extend(
+                    self.extract_lineage(
+                        table, ds_urn, upstream_tables_by_name.get(table.full_name)
+                    )
+                )
 
             self.append_container_mcp(
                 dataset_mcps,
@@ -409,21 +544,27 @@ class Mapper:
                 dataset.tags,
             )
 
+        self._dataset_mcps_cache[cache_key] = dataset_mcps
+
         return dataset_mcps
 
     @staticmethod
     def transform_tags(tags: List[str]) -> GlobalTagsClass:
+        # Dedup endorsement tags and bind the urn builder and association
+        # class to locals; this runs once per tagged entity
+        _make_tag_urn = builder.make_tag_urn
+        _TagAssociation = TagAssociationClass
         return GlobalTagsClass(
             tags=[
-                TagAssociationClass(builder.make_tag_urn(tag_to_add))
-                for tag_to_add in tags
+                _TagAssociation(_make_tag_urn(tag_to_add))
+                for tag_to_add in dict.fromkeys(tags)
             ]
         )
 
     def to_datahub_chart_mcp(
         self,
         tile: powerbi_data_classes.Tile,
-        ds_mcps: List[MetadataChangeProposalWrapper],
+        ds_input: List[str],
         workspace: powerbi_data_classes.Workspace,
     ) -> List[MetadataChangeProposalWrapper]:
         """
@@ -439,8 +580,6 @@ class Mapper:
 
         logger.info(f"{Constant.CHART_URN}={chart_urn}")
 
-        ds_input: List[str] = self.to_urn_set(ds_mcps)
-
         def tile_custom_properties(tile: powerbi_data_classes.Tile) -> dict:
             custom_properties: dict = {
                 Constant.CREATED_FROM: tile.createdFrom.value,
@@ -462,47 +601,36 @@ class Mapper:
         chart_info_instance = ChartInfoClass(
             title=tile.title or "",
             description=tile.title or "",
-            lastModified=ChangeAuditStamps(),
+            lastModified=_EMPTY_AUDIT_STAMPS,
             inputs=ds_input,
             externalUrl=tile.report.webUrl if tile.report else None,
             customProperties=tile_custom_properties(tile),
         )
 
-        info_mcp = self.new_mcp(
-            entity_type=Constant.CHART,
-            entity_urn=chart_urn,
-            aspect_name=Constant.CHART_INFO,
-            aspect=chart_info_instance,
-        )
-
-        # removed status mcp
-        status_mcp = self.new_mcp(
-            entity_type=Constant.CHART,
-            entity_urn=chart_urn,
-            aspect_name=Constant.STATUS,
-            aspect=StatusClass(removed=False),
-        )
-
         # ChartKey status
         chart_key_instance = ChartKeyClass(
             dashboardTool=self.__config.platform_name,
-            chartId=Constant.CHART_ID.format(tile.id),
+            chartId=_CHART_ID_FMT % tile.id,
         )
 
-        chart_key_mcp = self.new_mcp(
-            entity_type=Constant.CHART,
-            entity_urn=chart_urn,
-            aspect_name=Constant.CHART_KEY,
-            aspect=chart_key_instance,
-        )
-        browse_path = BrowsePathsClass(paths=["/powerbi/{}".format(workspace.name)])
-        browse_path_mcp = self.new_mcp(
-            entity_type=Constant.CHART,
-            entity_urn=chart_urn,
-            aspect_name=Constant.BROWSERPATH,
-            aspect=browse_path,
-        )
-        result_mcps = [info_mcp, status_mcp, chart_key_mcp, browse_path_mcp]
+        # Build the per-chart aspects in one pass; binding the wrapper class to
+        # a local avoids a global lookup per aspect on this hot path
+        _MCP = MetadataChangeProposalWrapper
+        result_mcps = [
+            _MCP(
+                entityType=Constant.CHART,
+                changeType=ChangeTypeClass.UPSERT,
+                entityUrn=chart_urn,
+                aspectName=aspect_name,
+                aspect=aspect,
+            )
+            for aspect_name, aspect in (
+                (Constant.CHART_INFO, chart_info_instance),
+                (Constant.STATUS, StatusClass(removed=False)),
+                (Constant.CHART_KEY, chart_key_instance),
+                (Constant.BROWSERPATH, self._workspace_browse_path(workspace.name)),
+            )
+        ]
 
         self.append_container_mcp(
             result_mcps,
@@ -514,12 +642,14 @@ class Mapper:
 
     # written in this style to fix linter error
     def to_urn_set(self, mcps: List[MetadataChangeProposalWrapper]) -> List[str]:
-        return deduplicate_list(
-            [
+        # dict.fromkeys keeps insertion order and dedups in a single pass,
+        # without materializing an intermediate list
+        return list(
+            dict.fromkeys(
                 mcp.entityUrn
                 for mcp in mcps
                 if mcp is not None and mcp.entityUrn is not None
-            ]
+            )
         )
 
     def to_datahub_dashboard_mcp(
@@ -554,79 +684,48 @@ class Mapper:
             description=dashboard.description,
             title=dashboard.displayName or "",
             charts=chart_urn_list,
-            lastModified=ChangeAuditStamps(),
+            lastModified=_EMPTY_AUDIT_STAMPS,
             dashboardUrl=dashboard.webUrl,
             customProperties={**chart_custom_properties(dashboard)},
         )
 
-        info_mcp = self.new_mcp(
-            entity_type=Constant.DASHBOARD,
-            entity_urn=dashboard_urn,
-            aspect_name=Constant.DASHBOARD_INFO,
-            aspect=dashboard_info_cls,
-        )
-
-        # removed status mcp
-        removed_status_mcp = self.new_mcp(
-            entity_type=Constant.DASHBOARD,
-            entity_urn=dashboard_urn,
-            aspect_name=Constant.STATUS,
-            aspect=StatusClass(removed=False),
-        )
-
         # dashboardKey mcp
         dashboard_key_cls = DashboardKeyClass(
             dashboardTool=self.__config.platform_name,
-            dashboardId=Constant.DASHBOARD_ID.format(dashboard.id),
-        )
-
-        # Dashboard key
-        dashboard_key_mcp = self.new_mcp(
-            entity_type=Constant.DASHBOARD,
-            entity_urn=dashboard_urn,
-            aspect_name=Constant.DASHBOARD_KEY,
-            aspect=dashboard_key_cls,
+            dashboardId=_DASHBOARD_ID_FMT % dashboard.id,
         )
 
-        # Dashboard Ownership
-        owners = [
-            OwnerClass(owner=user_urn, type=OwnershipTypeClass.NONE)
-            for user_urn in user_urn_list
-            if user_urn is not None
+        # Build the per-dashboard aspects in one pass; binding the wrapper
+        # class to a local avoids a global lookup per aspect
+        _MCP = MetadataChangeProposalWrapper
+        aspects: List[Tuple[str, Any]] = [
+            (
+                Constant.BROWSERPATH,
+                self._workspace_browse_path(dashboard.workspace_name),
+            ),
+            (Constant.DASHBOARD_INFO, dashboard_info_cls),
+            (Constant.STATUS, StatusClass(removed=False)),
+            (Constant.DASHBOARD_KEY, dashboard_key_cls),
         ]
 
-        owner_mcp = None
-        if len(owners) > 0:
-            # Dashboard owner MCP
-            ownership = OwnershipClass(owners=owners)
-            owner_mcp = self.new_mcp(
-                entity_type=Constant.DASHBOARD,
-                entity_urn=dashboard_urn,
-                aspect_name=Constant.OWNERSHIP,
-                aspect=ownership,
-            )
-
-        # Dashboard browsePaths
-        browse_path = BrowsePathsClass(
-            paths=[f"/{Constant.PLATFORM_NAME}/{dashboard.workspace_name}"]
-        )
-        browse_path_mcp = self.new_mcp(
-            entity_type=Constant.DASHBOARD,
-            entity_urn=dashboard_urn,
-            aspect_name=Constant.BROWSERPATH,
-            aspect=browse_path,
-        )
+        # Dashboard Ownership; to_urn_set already filtered out None urns
+        if user_urn_list:
+            _OWNER = OwnerClass
+            _NONE = OwnershipTypeClass.NONE
+            owners = [_OWNER(owner=user_urn, type=_NONE) for user_urn in user_urn_list]
+            aspects.append((Constant.OWNERSHIP, OwnershipClass(owners=owners)))
 
         list_of_mcps = [
-            browse_path_mcp,
-            info_mcp,
-            removed_status_mcp,
-            dashboard_key_mcp,
+            _MCP(
+                entityType=Constant.DASHBOARD,
+                changeType=ChangeTypeClass.UPSERT,
+                entityUrn=dashboard_urn,
+                aspectName=aspect_name,
+                aspect=aspect,
+            )
+            for aspect_name, aspect in aspects
         ]
 
-        if owner_mcp is not None:
-            list_of_mcps.append(owner_mcp)
-
         self.append_container_mcp(
             list_of_mcps,
             workspace,
@@ -649,26 +748,42 @@ class Mapper:
         entity_urn: str,
         dataset: Optional[powerbi_data_classes.PowerBIDataset] = None,
     ) -> None:
+        if not self._extract_containers:
+            return None
         if self.__config.extract_datasets_to_containers and isinstance(
             dataset, powerbi_data_classes.PowerBIDataset
         ):
-            container_key = dataset.get_dataset_key(self.__config.platform_name)
+            cache_id = f"dataset-{dataset.id}"
         elif self.__config.extract_workspaces_to_containers:
-            container_key = workspace.get_workspace_key(
-                platform_name=self.__config.platform_name,
-                platform_instance=self.__config.platform_instance,
-                workspace_id_as_urn_part=self.__config.workspace_id_as_urn_part,
-            )
+            cache_id = f"workspace-{workspace.id}"
         else:
             return None
 
-        container_urn = builder.make_container_urn(
-            guid=container_key.guid(),
-        )
+        # Key construction and guid hashing are invariant per workspace or
+        # dataset, so the aspect is built once and shared across entities
+        container_aspect = self._container_aspect_cache.get(cache_id)
+        if container_aspect is None:
+            if cache_id.startswith("dataset-"):
+                # The dataset cache id is only built from a real dataset above
+                assert dataset is not None
+                container_key = dataset.get_dataset_key(self.__config.platform_name)
+            else:
+                container_key = workspace.get_workspace_key(
+                    platform_name=self.__config.platform_name,
+                    platform_instance=self.__config.platform_instance,
+                    workspace_id_as_urn_part=self.__config.workspace_id_as_urn_part,
+                )
+
+            container_urn = builder.make_container_urn(
+                guid=container_key.guid(),
+            )
+            container_aspect = ContainerClass(container=f"{container_urn}")
+            self._container_aspect_cache[cache_id] = container_aspect
+
         mcp = MetadataChangeProposalWrapper(
             changeType=ChangeTypeClass.UPSERT,
             entityUrn=entity_urn,
-            aspect=ContainerClass(container=f"{container_urn}"),
+            aspect=container_aspect,
         )
         list_of_mcps.append(mcp)
 
@@ -705,7 +820,7 @@ class Mapper:
         entity_type: str,
         tags: List[str],
     ) -> None:
-        if self.__config.extract_endorsements_to_tags and tags:
+        if self._extract_endorsements and tags:
             tags_mcp = self.new_mcp(
                 entity_type=entity_type,
                 entity_urn=entity_urn,
@@ -743,32 +858,48 @@ class Mapper:
     def to_datahub_users(
         self, users: List[powerbi_data_classes.User]
     ) -> List[MetadataChangeProposalWrapper]:
-        user_mcps = []
+        user_mcps: List[MetadataChangeProposalWrapper] = []
+        seen_urns: Set[str] = set()
+        owner_criteria = self.__config.ownership.owner_criteria
 
         for user in users:
-            if user:
-                user_rights = [
+            if not user:
+                continue
+            if owner_criteria is not None and not (
+                user.principalType == "User"
+                and {
                     user.datasetUserAccessRight,
                     user.reportUserAccessRight,
                     user.dashboardUserAccessRight,
                     user.groupUserAccessRight,
-                ]
-                if (
-                    user.principalType == "User"
-                    and self.__config.ownership.owner_criteria
-                    and len(
-                        set(user_rights) & set(self.__config.ownership.owner_criteria)
-                    )
-                    > 0
-                ):
-                    user_mcps.extend(self.to_datahub_user(user))
-                elif self.__config.ownership.owner_criteria is None:
-                    user_mcps.extend(self.to_datahub_user(user))
-                else:
-                    continue
+                }.intersection(owner_criteria)
+            ):
+                continue
+            # The same user often appears several times in the access list;
+            # hash the urn once instead of emitting duplicate MCPs
+            for user_mcp in self.to_datahub_user(user):
+                urn = user_mcp.entityUrn
+                if urn is not None:
+                    if urn in seen_urns:
+                        continue
+                    seen_urns.add(urn)
+                user_mcps.append(user_mcp)
 
         return user_mcps
 
+    def _unemitted_user_mcps(
+        self, user_mcps: List[MetadataChangeProposalWrapper]
+    ) -> Iterable[MetadataChangeProposalWrapper]:
+        # Users are still passed in full to the dashboard ownership aspect;
+        # only their corp-user key MCPs are deduped across the run
+        for user_mcp in user_mcps:
+            urn = user_mcp.entityUrn
+            if urn is not None:
+                if urn in self._emitted_user_urns:
+                    continue
+                self._emitted_user_urns.add(urn)
+            yield user_mcp
+
     def to_datahub_chart(
         self,
         tiles: List[powerbi_data_classes.Tile],
@@ -785,15 +916,23 @@ class Mapper:
 
         logger.info(f"Converting tiles(count={len(tiles)}) to charts")
 
+        seen_dataset_ids: Set[str] = set()
         for tile in tiles:
             if tile is None:
                 continue
             # First convert the dataset to MCP, because dataset mcp is used in input attribute of chart mcp
             dataset_mcps = self.to_datahub_dataset(tile.dataset, workspace)
             # Now convert tile to chart MCP
-            chart_mcp = self.to_datahub_chart_mcp(tile, dataset_mcps, workspace)
+            chart_mcp = self.to_datahub_chart_mcp(
+                tile, self.to_urn_set(dataset_mcps), workspace
+            )
 
-            ds_mcps.extend(dataset_mcps)
+            # Tiles of a dashboard frequently share a dataset; emit its MCPs
+            # only for the first tile referencing it
+            if tile.dataset is None or tile.dataset.id not in seen_dataset_ids:
+                if tile.dataset is not None:
+                    seen_dataset_ids.add(tile.dataset.id)
+                ds_mcps.extend(dataset_mcps)
             chart_mcps.extend(chart_mcp)
 
         # Return dataset and chart MCPs
@@ -804,9 +943,7 @@ class Mapper:
         self,
         dashboard: powerbi_data_classes.Dashboard,
         workspace: powerbi_data_classes.Workspace,
-    ) -> List[EquableMetadataWorkUnit]:
-        mcps = []
-
+    ) -> Iterable[EquableMetadataWorkUnit]:
         logger.info(
             f"Converting dashboard={dashboard.displayName} to datahub dashboard"
         )
@@ -822,17 +959,28 @@ class Mapper:
             MetadataChangeProposalWrapper
         ] = self.to_datahub_dashboard_mcp(dashboard, workspace, chart_mcps, user_mcps)
 
-        # Now add MCPs in sequence
-        mcps.extend(ds_mcps)
-        if self.__config.ownership.create_corp_user:
-            mcps.extend(user_mcps)
-        mcps.extend(chart_mcps)
-        mcps.extend(dashboard_mcps)
+        user_emission = (
+            self._unemitted_user_mcps(user_mcps)
+            if self.__config.ownership.create_corp_user
+            else []
+        )
 
-        # Convert MCP to work_units
-        work_units = map(self._to_work_unit, mcps)
-        # Return set of work_unit
-        return deduplicate_list([wu for wu in work_units if wu is not None])
+        # Stream the work units in sequence instead of materializing every
+        # MCP of the dashboard first; dedup on the fly by work-unit id
+        yield from self._stream_work_units(
+            (ds_mcps, user_emission, chart_mcps, dashboard_mcps)
+        )
+
+    def _stream_work_units(
+        self, mcp_groups: Iterable[Iterable[MetadataChangeProposalWrapper]]
+    ) -> Iterable[EquableMetadataWorkUnit]:
+        seen_ids: Set[str] = set()
+        for mcps in mcp_groups:
+            for mcp in mcps:
+                work_unit = self._to_work_unit(mcp)
+                if work_unit.id not in seen_ids:
+                    seen_ids.add(work_unit.id)
+                    yield work_unit
 
     def pages_to_chart(
         self,
@@ -848,71 +996,76 @@ class Mapper:
 
         logger.debug(f"Converting pages(count={len(pages)}) to charts")
 
-        def to_chart_mcps(
-            page: powerbi_data_classes.Page,
-            ds_mcps: List[MetadataChangeProposalWrapper],
-        ) -> List[MetadataChangeProposalWrapper]:
-            logger.debug(f"Converting page {page.displayName} to chart")
-            # Create a URN for chart
-            chart_urn = builder.make_chart_urn(
-                platform=self.__config.platform_name,
-                platform_instance=self.__config.platform_instance,
-                name=page.get_urn_part(),
-            )
+        # The dataset MCPs and browse path are the same for every page of the
+        # report; compute them once instead of once per page
+        ds_input: List[str] = self.to_urn_set(ds_mcps)
+        browse_path: BrowsePathsClass = self._workspace_browse_path(workspace.name)
 
-            logger.debug(f"{Constant.CHART_URN}={chart_urn}")
+        for page in pages:
+            if page is None:
+                continue
+            # Now convert tile to chart MCP
+            chart_mcp = self._page_to_chart_mcps(page, ds_input, workspace, browse_path)
+            chart_mcps.extend(chart_mcp)
 
-            ds_input: List[str] = self.to_urn_set(ds_mcps)
+        return chart_mcps
 
-            # Create chartInfo mcp
-            # Set chartUrl only if tile is created from Report
-            chart_info_instance = ChartInfoClass(
-                title=page.displayName or "",
-                description=page.displayName or "",
-                lastModified=ChangeAuditStamps(),
-                inputs=ds_input,
-                customProperties={Constant.ORDER: str(page.order)},
-            )
+    def _page_to_chart_mcps(
+        self,
+        page: powerbi_data_classes.Page,
+        ds_input: List[str],
+        workspace: powerbi_data_classes.Workspace,
+        browse_path: BrowsePathsClass,
+    ) -> List[MetadataChangeProposalWrapper]:
+        logger.debug(f"Converting page {page.displayName} to chart")
+        # Create a URN for chart
+        chart_urn = builder.make_chart_urn(
+            platform=self.__config.platform_name,
+            platform_instance=self.__config.platform_instance,
+            name=page.get_urn_part(),
+        )
 
-            info_mcp = self.new_mcp(
-                entity_type=Constant.CHART,
-                entity_urn=chart_urn,
-                aspect_name=Constant.CHART_INFO,
-                aspect=chart_info_instance,
-            )
+        logger.debug(f"{Constant.CHART_URN}={chart_urn}")
 
-            # removed status mcp
-            status_mcp = self.new_mcp(
-                entity_type=Constant.CHART,
-                entity_urn=chart_urn,
-                aspect_name=Constant.STATUS,
-                aspect=StatusClass(removed=False),
-            )
-            browse_path = BrowsePathsClass(paths=["/powerbi/{}".format(workspace.name)])
-            browse_path_mcp = self.new_mcp(
-                entity_type=Constant.CHART,
-                entity_urn=chart_urn,
-                aspect_name=Constant.BROWSERPATH,
-                aspect=browse_path,
-            )
-            list_of_mcps = [info_mcp, status_mcp, browse_path_mcp]
+        # Create chartInfo mcp
+        # Set chartUrl only if tile is created from Report
+        chart_info_instance = ChartInfoClass(
+            title=page.displayName or "",
+            description=page.displayName or "",
+            lastModified=_EMPTY_AUDIT_STAMPS,
+            inputs=ds_input,
+            customProperties={Constant.ORDER: str(page.order)},
+        )
 
-            self.append_container_mcp(
-                list_of_mcps,
-                workspace,
-                chart_urn,
-            )
+        info_mcp = self.new_mcp(
+            entity_type=Constant.CHART,
+            entity_urn=chart_urn,
+            aspect_name=Constant.CHART_INFO,
+            aspect=chart_info_instance,
+        )
 
-            return list_of_mcps
+        # removed status mcp
+        status_mcp = self.new_mcp(
+            entity_type=Constant.CHART,
+            entity_urn=chart_urn,
+            aspect_name=Constant.STATUS,
+            aspect=StatusClass(removed=False),
+        )
+        browse_path_mcp = self.new_mcp(
+            entity_type=Constant.CHART,
+            entity_urn=chart_urn,
+            aspect_name=Constant.BROWSERPATH,
+            aspect=browse_path,
+        )
+        list_of_mcps = [info_mcp, status_mcp, browse_path_mcp]
 
-        for page in pages:
-            if page is None:
-                continue
-            # Now convert tile to chart MCP
-            chart_mcp = to_chart_mcps(page, ds_mcps)
-            chart_mcps.extend(chart_mcp)
+        self.append_container_mcp(
+            list_of_mcps,
+            workspace,
+            chart_urn,
+        )
 
-        return chart_mcps
+        return list_of_mcps
 
     def report_to_dashboard(
         self,
@@ -939,7 +1092,7 @@ class Mapper:
             description=report.description,
             title=report.name or "",
             charts=chart_urn_list,
-            lastModified=ChangeAuditStamps(),
+            lastModified=_EMPTY_AUDIT_STAMPS,
             dashboardUrl=report.webUrl,
         )
 
@@ -961,7 +1114,7 @@ class Mapper:
         # dashboardKey mcp
         dashboard_key_cls = DashboardKeyClass(
             dashboardTool=self.__config.platform_name,
-            dashboardId=Constant.DASHBOARD_ID.format(report.id),
+            dashboardId=_DASHBOARD_ID_FMT % report.id,
         )
 
         # Dashboard key
@@ -971,15 +1124,12 @@ class Mapper:
             aspect_name=Constant.DASHBOARD_KEY,
             aspect=dashboard_key_cls,
         )
-        # Report Ownership
-        owners = [
-            OwnerClass(owner=user_urn, type=OwnershipTypeClass.NONE)
-            for user_urn in user_urn_list
-            if user_urn is not None
-        ]
-
+        # Report Ownership; to_urn_set already filtered out None urns
         owner_mcp = None
-        if len(owners) > 0:
+        if user_urn_list:
+            _OWNER = OwnerClass
+            _NONE = OwnershipTypeClass.NONE
+            owners = [_OWNER(owner=user_urn, type=_NONE) for user_urn in user_urn_list]
             # Report owner MCP
             ownership = OwnershipClass(owners=owners)
             owner_mcp = self.new_mcp(
@@ -990,14 +1140,11 @@ class Mapper:
             )
 
         # Report browsePaths
-        browse_path = BrowsePathsClass(
-            paths=[f"/{Constant.PLATFORM_NAME}/{workspace.name}"]
-        )
         browse_path_mcp = self.new_mcp(
             entity_type=Constant.DASHBOARD,
             entity_urn=dashboard_urn,
             aspect_name=Constant.BROWSERPATH,
-            aspect=browse_path,
+            aspect=self._workspace_browse_path(workspace.name),
         )
 
         sub_type_mcp = self.new_mcp(
@@ -1038,8 +1185,6 @@ class Mapper:
         report: powerbi_data_classes.Report,
         workspace: powerbi_data_classes.Workspace,
     ) -> Iterable[MetadataWorkUnit]:
-        mcps: List[MetadataChangeProposalWrapper] = []
-
         logger.debug(f"Converting dashboard={report.name} to datahub dashboard")
 
         # Convert user to CorpUser
@@ -1051,16 +1196,17 @@ class Mapper:
         # Let's convert report to datahub dashboard
         report_mcps = self.report_to_dashboard(workspace, report, chart_mcps, user_mcps)
 
-        # Now add MCPs in sequence
-        mcps.extend(ds_mcps)
-        if self.__config.ownership.create_corp_user:
-            mcps.extend(user_mcps)
-        mcps.extend(chart_mcps)
-        mcps.extend(report_mcps)
+        user_emission = (
+            self._unemitted_user_mcps(user_mcps)
+            if self.__config.ownership.create_corp_user
+            else []
+        )
 
-        # Convert MCP to work_units
-        work_units = map(self._to_work_unit, mcps)
-        return work_units
+        # Stream work units in sequence instead of materializing every MCP of
+        # the report first
+        yield from self._stream_work_units(
+            (ds_mcps, user_emission, chart_mcps, report_mcps)
+        )
 
 
 @platform_name("PowerBI")
@@ -1155,17 +1301,48 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
             for workunit in workspace_workunits:
                 # Return workunit to Datahub Ingestion framework
                 yield workunit
-        for dashboard in workspace.dashboards:
+
+        # Prefetch PowerBi users for upcoming dashboards on a small thread
+        # pool while the main thread converts the current dashboard: the
+        # per-dashboard REST call is network-bound, the MCP mapping is
+        # CPU-bound, and pipelining the two hides the HTTP latency. Mapping
+        # stays on this thread so the Mapper caches need no locking and work
+        # units keep their order.
+        def fetch_dashboard_users(
+            dashboard: powerbi_data_classes.Dashboard,
+        ) -> Optional[Exception]:
             try:
-                # Fetch PowerBi users for dashboards
                 dashboard.users = self.powerbi_client.get_dashboard_users(dashboard)
+                return None
+            except Exception as e:
+                return e
+
+        def dashboard_results() -> Iterable[
+            Tuple[powerbi_data_classes.Dashboard, Optional[Exception]]
+        ]:
+            if len(workspace.dashboards) > 1:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, len(workspace.dashboards))
+                ) as executor:
+                    futures = [
+                        executor.submit(fetch_dashboard_users, dashboard)
+                        for dashboard in workspace.dashboards
+                    ]
+                    for dashboard, future in zip(workspace.dashboards, futures):
+                        yield dashboard, future.result()
+            else:
+                for dashboard in workspace.dashboards:
+                    yield dashboard, fetch_dashboard_users(dashboard)
+
+        for dashboard, error in dashboard_results():
+            if error is None:
                 # Increase dashboard and tiles count in report
                 self.reporter.report_dashboards_scanned()
                 self.reporter.report_charts_scanned(count=len(dashboard.tiles))
-            except Exception as e:
-                message = f"Error ({e}) occurred while loading dashboard {dashboard.displayName}(id={dashboard.id}) tiles."
+            else:
+                message = f"Error ({error}) occurred while loading dashboard {dashboard.displayName}(id={dashboard.id}) tiles."
 
-                logger.exception(message, e)
+                logger.exception(message, error)
                 self.reporter.report_warning(dashboard.id, message)
             # Convert PowerBi Dashboard and child entities to Datahub work unit to ingest into Datahub
             workunits = self.mapper.to_datahub_work_units(dashboard, workspace)
@@ -1,3 +1,4 @@
+import concurrent.futures
 import json
 import logging
 import sys
@@ -444,6 +445,15 @@ class PowerBiAPI:
     ) -> Iterable[Workspace]:
         workspaces = self._fill_metadata_from_scan_result(workspaces=workspaces)
         # First try to fill the admin detail as some regular metadata contains lineage to admin metadata
-        for workspace in workspaces:
-            self._fill_regular_metadata_detail(workspace=workspace)
+        if len(workspaces) > 1 and self.__config.scan_workers > 1:
+            # The regular-metadata fill is dominated by REST latency and the
+            # workspaces are independent; overlap the calls on a thread pool
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.__config.scan_workers, len(workspaces))
+            ) as executor:
+                # Drain the iterator so worker exceptions surface here
+                list(executor.map(self._fill_regular_metadata_detail, workspaces))
+        else:
+            for workspace in workspaces:
+                self._fill_regular_metadata_detail(workspace=workspace)
         return workspaces
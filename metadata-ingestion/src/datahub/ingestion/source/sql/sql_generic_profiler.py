@@ -1,16 +1,16 @@
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.reflection import Inspector
 
 from datahub.emitter.mce_builder import make_dataset_urn_with_platform_instance
-from datahub.ingestion.source.ge_data_profiler import (
-    DatahubGEProfiler,
-    GEProfilerRequest,
-)
+from datahub.ingestion.source.ge_data_profiler import GEProfilerRequest
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
 from datahub.ingestion.source.sql.sql_config import SQLAlchemyConfig
 from datahub.ingestion.source.sql.sql_generic import BaseTable, BaseView
@@ -19,6 +19,9 @@ from datahub.metadata.com.linkedin.pegasus2avro.dataset import DatasetProfile
 from datahub.metadata.schema_classes import DatasetProfileClass
 from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
 
+if TYPE_CHECKING:
+    from datahub.ingestion.source.ge_data_profiler import DatahubGEProfiler
+
 
 @dataclass
 class DetailedProfilerReportMixin:
@@ -62,6 +65,33 @@ class GenericProfiler:
         self.report = report
         self.platform = platform
         self.state_handler = state_handler
+        self._engine: Optional[Engine] = None
+        self._engine_lock = threading.Lock()
+
+        # Eligibility inputs that are invariant across the tables of a run
+        size_limit = self.config.profiling.profile_table_size_limit
+        self._size_limit_bytes: Optional[int] = (
+            size_limit * 2**30 if size_limit is not None else None
+        )
+        self._row_limit: Optional[int] = self.config.profiling.profile_table_row_limit
+        self._default_threshold_time: Optional[datetime] = (
+            datetime.now(timezone.utc)
+            - timedelta(self.config.profiling.profile_if_updated_since_days)
+            if self.config.profiling.profile_if_updated_since_days is not None
+            else None
+        )
+
+    def _get_engine(self) -> Engine:
+        # Engine creation opens connections and re-runs dialect negotiation;
+        # one engine (and its pool) is enough for all inspectors and profiler
+        # instances of this run
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    url = self.config.get_sql_alchemy_url()
+                    logger.debug(f"sql_alchemy_url={url}")
+                    self._engine = create_engine(url, **self.config.options)
+        return self._engine
 
     def generate_profiles(
         self,
@@ -79,14 +109,23 @@ class GenericProfiler:
         table_level_profile_requests: List[TableProfilerRequest] = [
             request for request in requests if request.profile_table_level_only
         ]
-        for request in table_level_profile_requests:
-            profile = DatasetProfile(
-                timestampMillis=int(datetime.now().timestamp() * 1000),
-                columnCount=request.table.column_count,
-                rowCount=request.table.rows_count,
-                sizeInBytes=request.table.size_in_bytes,
+        if table_level_profile_requests:
+            # All table-level profiles belong to the same run; sampling the
+            # clock once gives them one timestamp, and time_ns avoids the
+            # datetime allocation and float conversion
+            profile_timestamp = time.time_ns() // 1_000_000
+            yield from (
+                (
+                    request,
+                    DatasetProfile(
+                        timestampMillis=profile_timestamp,
+                        columnCount=request.table.column_count,
+                        rowCount=request.table.rows_count,
+                        sizeInBytes=request.table.size_in_bytes,
+                    ),
+                )
+                for request in table_level_profile_requests
             )
-            yield (request, profile)
 
         if not ge_profile_requests:
             return
@@ -101,9 +140,7 @@ class GenericProfiler:
         # This method can be overridden in the case that you want to dynamically
         # run on multiple databases.
 
-        url = self.config.get_sql_alchemy_url()
-        logger.debug(f"sql_alchemy_url={url}")
-        engine = create_engine(url, **self.config.options)
+        engine = self._get_engine()
         with engine.connect() as conn:
             inspector = inspect(conn)
             yield inspector
@@ -111,17 +148,14 @@ class GenericProfiler:
     def get_profiler_instance(
         self, db_name: Optional[str] = None
     ) -> "DatahubGEProfiler":
-        logger.debug(f"Getting profiler instance from {self.platform}")
-        url = self.config.get_sql_alchemy_url()
+        from datahub.ingestion.source.ge_data_profiler import DatahubGEProfiler
 
-        logger.debug(f"sql_alchemy_url={url}")
-
-        engine = create_engine(url, **self.config.options)
-        with engine.connect() as conn:
-            inspector = inspect(conn)
+        logger.debug(f"Getting profiler instance from {self.platform}")
 
+        # DatahubGEProfiler accepts an engine directly and opens its own
+        # connections; the connect/inspect roundtrip only recovered the bind
         return DatahubGEProfiler(
-            conn=inspector.bind,
+            conn=self._get_engine(),
             report=self.report,
             config=self.config.profiling,
             platform=self.platform,
@@ -134,18 +168,18 @@ class GenericProfiler:
         size_in_bytes: Optional[int],
         rows_count: Optional[int],
     ) -> bool:
-        dataset_urn = make_dataset_urn_with_platform_instance(
-            self.platform,
-            dataset_name,
-            self.config.platform_instance,
-            self.config.env,
-        )
-
         if not self.config.table_pattern.allowed(dataset_name):
             return False
 
         last_profiled: Optional[int] = None
         if self.state_handler:
+            # The urn is only needed for profiling-state lookups
+            dataset_urn = make_dataset_urn_with_platform_instance(
+                self.platform,
+                dataset_name,
+                self.config.platform_instance,
+                self.config.env,
+            )
             last_profiled = self.state_handler.get_last_profiled(dataset_urn)
             if last_profiled:
                 # If profiling state exists we have to carry over to the new state
@@ -154,38 +188,34 @@ class GenericProfiler:
         threshold_time: Optional[datetime] = (
             datetime.fromtimestamp(last_profiled / 1000, timezone.utc)
             if last_profiled
-            else None
+            else self._default_threshold_time
         )
-        if (
-            not threshold_time
-            and self.config.profiling.profile_if_updated_since_days is not None
-        ):
-            threshold_time = datetime.now(timezone.utc) - timedelta(
-                self.config.profiling.profile_if_updated_since_days
-            )
 
         if not self.config.profile_pattern.allowed(dataset_name):
             return False
 
-        schema_name = dataset_name.rsplit(".", 1)[0]
+        # The schema name is only needed on the skip branches; tables passing
+        # every check (the common case) shouldn't pay for the split
         if (threshold_time is not None) and (
             last_altered is not None and last_altered < threshold_time
         ):
+            schema_name = dataset_name.rsplit(".", 1)[0]
             self.report.profiling_skipped_not_updated[schema_name] += 1
             return False
 
-        if self.config.profiling.profile_table_size_limit is not None and (
-            size_in_bytes is None
-            or size_in_bytes / (2**30)
-            > self.config.profiling.profile_table_size_limit
+        # Integer compare against the precomputed byte limit; the original
+        # float division per table is unnecessary
+        if self._size_limit_bytes is not None and (
+            size_in_bytes is None or size_in_bytes > self._size_limit_bytes
         ):
+            schema_name = dataset_name.rsplit(".", 1)[0]
             self.report.profiling_skipped_size_limit[schema_name] += 1
             return False
 
-        if self.config.profiling.profile_table_row_limit is not None and (
-            rows_count is None
-            or rows_count > self.config.profiling.profile_table_row_limit
+        if self._row_limit is not None and (
+            rows_count is None or rows_count > self._row_limit
         ):
+            schema_name = dataset_name.rsplit(".", 1)[0]
             self.report.profiling_skipped_row_limit[schema_name] += 1
             return False
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+from typing import Any, Dict, Iterable, List, Type
 
 import pydantic
 
@@ -107,7 +107,10 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream the difference against the other state's prebuilt urn set
+        # instead of materializing both sides; also keeps this state's order.
+        other_urns = other_checkpoint_state._urns_set
+        diff = (urn for urn in self.urns if urn not in other_urns)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -135,18 +138,13 @@ class GenericCheckpointState(CheckpointStateBase):
 def compute_percent_entities_changed(
     new_entities: List[str], old_entities: List[str]
 ) -> float:
-    (overlap_count, old_count, _,) = _get_entity_overlap_and_cardinalities(
-        new_entities=new_entities, old_entities=old_entities
-    )
-
-    if old_count:
-        return (1 - overlap_count / old_count) * 100.0
-    return 0.0
-
-
-def _get_entity_overlap_and_cardinalities(
-    new_entities: List[str], old_entities: List[str]
-) -> Tuple[int, int, int]:
-    new_set = set(new_entities)
     old_set = set(old_entities)
-    return len(new_set.intersection(old_set)), len(old_set), len(new_set)
+    old_count = len(old_set)
+    if not old_count:
+        return 0.0
+
+    # Checkpoint states dedup their urns on construction, so the overlap can
+    # be counted in a single membership pass without materializing a second
+    # set of the new entities.
+    overlap_count = sum(1 for urn in new_entities if urn in old_set)
+    return (1 - overlap_count / old_count) * 100.0
@@ -176,15 +176,16 @@ class StaleEntityRemovalHandler(
             )
         return None
 
-    def _create_soft_delete_workunit(self, urn: str) -> MetadataWorkUnit:
-        logger.info(f"Soft-deleting stale entity - {urn}")
+    def _create_soft_delete_workunit(
+        self, urn: str, report: StaleEntityRemovalSourceReport
+    ) -> MetadataWorkUnit:
+        # Per-urn logging stays at debug; the caller logs an aggregate count
+        logger.debug(f"Soft-deleting stale entity - {urn}")
         mcp = MetadataChangeProposalWrapper(
             entityUrn=urn,
             aspect=StatusClass(removed=True),
         )
         wu = MetadataWorkUnit(id=f"soft-delete-{urn}", mcp=mcp)
-        report = self.source.get_report()
-        assert isinstance(report, StaleEntityRemovalSourceReport)
         report.report_workunit(wu)
         report.report_stale_entity_soft_deleted(urn)
         return wu
@@ -221,25 +222,32 @@ class StaleEntityRemovalHandler(
 
         assert self.stateful_ingestion_config
 
-        # Check if the entity delta is below the fail-safe threshold.
-        entity_difference_percent = cur_checkpoint_state.get_percent_entities_changed(
-            last_checkpoint_state
-        )
+        # The delta can only be non-zero when the previous state has urns and
+        # is a different state object; skip the per-urn scan otherwise (e.g.
+        # on first runs with an empty prior state).
         if (
-            entity_difference_percent
-            > self.stateful_ingestion_config.fail_safe_threshold
-            # Adding this check to protect against cases where get_percent_entities_changed returns over 100%.
-            # This previously happened due to a bug in the implementation, which caused this condition to be
-            # triggered too frequently.
-            and self.stateful_ingestion_config.fail_safe_threshold < 100.0
+            last_checkpoint_state is not cur_checkpoint_state
+            and last_checkpoint_state.urns
         ):
-            # Log the failure. This would prevent the current state from getting committed.
-            self.source.get_report().report_failure(
-                "stale-entity-removal",
-                f"Will not soft-delete entities, since we'd be deleting {entity_difference_percent:.1f}% of the existing entities. "
-                f"To force a deletion, increase the value of 'stateful_ingestion.fail_safe_threshold' (currently {self.stateful_ingestion_config.fail_safe_threshold})",
+            # Check if the entity delta is below the fail-safe threshold.
+            entity_difference_percent = (
+                cur_checkpoint_state.get_percent_entities_changed(last_checkpoint_state)
             )
-            return
+            if (
+                entity_difference_percent
+                > self.stateful_ingestion_config.fail_safe_threshold
+                # Adding this check to protect against cases where get_percent_entities_changed returns over 100%.
+                # This previously happened due to a bug in the implementation, which caused this condition to be
+                # triggered too frequently.
+                and self.stateful_ingestion_config.fail_safe_threshold < 100.0
+            ):
+                # Log the failure. This would prevent the current state from getting committed.
+                self.source.get_report().report_failure(
+                    "stale-entity-removal",
+                    f"Will not soft-delete entities, since we'd be deleting {entity_difference_percent:.1f}% of the existing entities. "
+                    f"To force a deletion, increase the value of 'stateful_ingestion.fail_safe_threshold' (currently {self.stateful_ingestion_config.fail_safe_threshold})",
+                )
+                return
 
         if self.source.get_report().events_produced == 0:
             # SUBTLE: By reporting this as a failure here, we also ensure that the
@@ -261,16 +269,32 @@ class StaleEntityRemovalHandler(
             )
             return
 
+        # Nothing can be stale when the previous state is empty or the same
+        # object as the current one.
+        if (
+            last_checkpoint_state is cur_checkpoint_state
+            or not last_checkpoint_state.urns
+        ):
+            return
+
         # Everything looks good, emit the soft-deletion workunits
+        report = self.source.get_report()
+        assert isinstance(report, StaleEntityRemovalSourceReport)
+        # Local frozen view; the loop body then avoids attribute loads on self
+        urns_to_skip = frozenset(self._urns_to_skip)
+        num_soft_deleted = 0
         for urn in last_checkpoint_state.get_urns_not_in(
             type="*", other_checkpoint_state=cur_checkpoint_state
         ):
-            if urn in self._urns_to_skip:
+            if urn in urns_to_skip:
                 logger.debug(
                     f"Not soft-deleting entity {urn} since it is in urns_to_skip"
                 )
                 continue
-            yield self._create_soft_delete_workunit(urn)
+            num_soft_deleted += 1
+            yield self._create_soft_delete_workunit(urn, report)
+        if num_soft_deleted:
+            logger.info(f"Soft-deleted {num_soft_deleted} stale entities")
 
     def add_entity_to_state(self, type: str, urn: str) -> None:
         if not self.is_checkpointing_enabled() or self._ignore_new_state():
@@ -1,10 +1,14 @@
 import dataclasses
+import heapq
 import logging
+import operator
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import (
     Callable,
     Counter,
+    DefaultDict,
     Dict,
     Generic,
     Iterable,
@@ -49,11 +53,49 @@ ResourceType = TypeVar("ResourceType")
 # The total number of characters allowed across all queries in a single workunit.
 TOTAL_BUDGET_FOR_QUERY_LIST = 24000
 
+# Shared allow-all default, so the unfiltered case is a single identity
+# check per event instead of a pattern evaluation.
+_ALLOW_ALL_PATTERN = AllowDenyPattern.allow_all()
+
 
 def default_user_urn_builder(email: str) -> str:
     return builder.make_user_urn(email.split("@")[0])
 
 
+def _memoized_user_urn_builder(
+    user_urn_builder: Optional[Callable[[str], str]],
+) -> Callable[[str], str]:
+    # The same users recur across buckets and urn construction is pure, so
+    # wrap the builder in a per-emission-pass cache.
+    return lru_cache(maxsize=65536)(
+        user_urn_builder if user_urn_builder is not None else default_user_urn_builder
+    )
+
+
+@lru_cache(maxsize=None)
+def _event_granularity(bucket_duration: BucketDuration) -> TimeWindowSizeClass:
+    # One shared instance per duration; never mutated after construction.
+    return TimeWindowSizeClass(unit=bucket_duration, multiple=1)
+
+
+@lru_cache(maxsize=4096)
+def _format_and_trim_query(
+    query: str,
+    budget_per_query: int,
+    query_trimmer_string: str,
+    format_sql_queries: bool,
+) -> str:
+    # The same top queries tend to recur across buckets and resources, so
+    # caching saves us from re-running sqlparse on every emission.
+    return trim_query(
+        format_sql_query(query, keyword_case="upper", reindent_aligned=True)
+        if format_sql_queries
+        else query,
+        budget_per_query=budget_per_query,
+        query_trimmer_string=query_trimmer_string,
+    )
+
+
 def make_usage_workunit(
     bucket_start_time: datetime,
     resource: ResourceType,
@@ -68,40 +110,69 @@ def make_usage_workunit(
     user_urn_builder: Optional[Callable[[str], str]] = None,
     total_budget_for_query_list: int = TOTAL_BUDGET_FOR_QUERY_LIST,
     query_trimmer_string: str = " ...",
+    unique_user_count: Optional[int] = None,
+    user_is_email: Optional[bool] = None,
+    timestamp_millis: Optional[int] = None,
 ) -> MetadataWorkUnit:
     if user_urn_builder is None:
         user_urn_builder = default_user_urn_builder
+    if timestamp_millis is None:
+        timestamp_millis = int(bucket_start_time.timestamp() * 1000)
+    if unique_user_count is None:
+        # user_freq may be a truncated top-n view, so callers that track the
+        # full user population should pass the real count explicitly.
+        unique_user_count = len(user_freq)
 
     top_sql_queries: Optional[List[str]] = None
     if query_freq is not None:
         budget_per_query: int = int(total_budget_for_query_list / top_n_queries)
+        # Queries that already fit the budget need neither formatting nor
+        # trimming when format_sql_queries is off; emit them as-is without
+        # going through the cache.
         top_sql_queries = [
-            trim_query(
-                format_sql_query(query, keyword_case="upper", reindent_aligned=True)
-                if format_sql_queries
-                else query,
-                budget_per_query=budget_per_query,
-                query_trimmer_string=query_trimmer_string,
+            query
+            if not format_sql_queries and len(query) <= budget_per_query
+            else _format_and_trim_query(
+                query, budget_per_query, query_trimmer_string, format_sql_queries
             )
             for query, _ in query_freq
         ]
 
-    usageStats = DatasetUsageStatisticsClass(
-        timestampMillis=int(bucket_start_time.timestamp() * 1000),
-        eventGranularity=TimeWindowSizeClass(unit=bucket_duration, multiple=1),
-        uniqueUserCount=len(user_freq),
-        totalSqlQueries=query_count,
-        topSqlQueries=top_sql_queries,
-        userCounts=[
-            DatasetUserUsageCountsClass(
+    # Bind the generated classes to locals; the comprehensions below run once
+    # per user/column and global loads add up on wide fan-out buckets.
+    _UserCounts = DatasetUserUsageCountsClass
+    _FieldCounts = DatasetFieldUsageCountsClass
+
+    # Callers that already guarantee their users are (or aren't) emails can
+    # pass user_is_email to drop the per-user substring scan.
+    if user_is_email is None:
+        user_counts = [
+            _UserCounts(
                 user=user_urn_builder(user),
                 count=count,
                 userEmail=user if "@" in user else None,
             )
             for user, count in user_freq
-        ],
+        ]
+    else:
+        user_counts = [
+            _UserCounts(
+                user=user_urn_builder(user),
+                count=count,
+                userEmail=user if user_is_email else None,
+            )
+            for user, count in user_freq
+        ]
+
+    usageStats = DatasetUsageStatisticsClass(
+        timestampMillis=timestamp_millis,
+        eventGranularity=_event_granularity(bucket_duration),
+        uniqueUserCount=unique_user_count,
+        totalSqlQueries=query_count,
+        topSqlQueries=top_sql_queries,
+        userCounts=user_counts,
         fieldCounts=[
-            DatasetFieldUsageCountsClass(
+            _FieldCounts(
                 fieldPath=column,
                 count=count,
             )
@@ -123,18 +194,35 @@ class GenericAggregatedDataset(Generic[ResourceType]):
     readCount: int = 0
     queryCount: int = 0
 
-    queryFreq: Counter[str] = dataclasses.field(default_factory=Counter)
-    userFreq: Counter[str] = dataclasses.field(default_factory=Counter)
+    # defaultdict(int) resolves missing keys in C, unlike Counter's
+    # Python-level __missing__ - add_read_entry is hot enough to care.
+    queryFreq: DefaultDict[str, int] = dataclasses.field(
+        default_factory=lambda: defaultdict(int)
+    )
+    userFreq: DefaultDict[str, int] = dataclasses.field(
+        default_factory=lambda: defaultdict(int)
+    )
+    # columnFreq stays a Counter, unlike the scalar-increment maps above:
+    # Counter.update(fields) counts a whole field list in C in one call.
     columnFreq: Counter[str] = dataclasses.field(default_factory=Counter)
 
+    def __post_init__(self) -> None:
+        # datetime.timestamp() does tz resolution per call; compute the
+        # emitted epoch millis once per bucket instead of per workunit.
+        self._bucket_ts_millis: int = int(self.bucket_start_time.timestamp() * 1000)
+
     def add_read_entry(
         self,
         user_email: Optional[str],
         query: Optional[str],
         fields: List[str],
-        user_email_pattern: AllowDenyPattern = AllowDenyPattern.allow_all(),
+        user_email_pattern: AllowDenyPattern = _ALLOW_ALL_PATTERN,
     ) -> None:
-        if user_email and not user_email_pattern.allowed(user_email):
+        if (
+            user_email
+            and user_email_pattern is not _ALLOW_ALL_PATTERN
+            and not user_email_pattern.allowed(user_email)
+        ):
             return
 
         self.readCount += 1
@@ -144,8 +232,13 @@ class GenericAggregatedDataset(Generic[ResourceType]):
         if query:
             self.queryCount += 1
             self.queryFreq[query] += 1
-        for column in fields:
-            self.columnFreq[column] += 1
+        if fields:
+            # A query referencing the same column twice should still count as
+            # one read of that column; dict.fromkeys dedupes while keeping
+            # the caller's column order.
+            self.columnFreq.update(
+                dict.fromkeys(fields, 1) if len(fields) > 1 else fields
+            )
 
     def make_usage_workunit(
         self,
@@ -157,17 +250,38 @@ class GenericAggregatedDataset(Generic[ResourceType]):
         user_urn_builder: Optional[Callable[[str], str]] = None,
         total_budget_for_query_list: int = TOTAL_BUDGET_FOR_QUERY_LIST,
         query_trimmer_string: str = " ...",
+        top_n_users: Optional[int] = None,
     ) -> MetadataWorkUnit:
         query_freq = (
-            self.queryFreq.most_common(top_n_queries) if include_top_n_queries else None
+            heapq.nlargest(
+                top_n_queries, self.queryFreq.items(), key=operator.itemgetter(1)
+            )
+            if include_top_n_queries
+            else None
+        )
+        # nlargest is O(U log n) vs O(U log U) for a full sort; only pay for
+        # the full ordering when the caller wants every user.
+        user_freq = (
+            heapq.nlargest(
+                top_n_users, self.userFreq.items(), key=operator.itemgetter(1)
+            )
+            if top_n_users is not None
+            else sorted(self.userFreq.items(), key=operator.itemgetter(1), reverse=True)
+        )
+        column_freq = (
+            sorted(self.columnFreq.items(), key=operator.itemgetter(1), reverse=True)
+            if self.columnFreq
+            else []
         )
         return make_usage_workunit(
             bucket_start_time=self.bucket_start_time,
             resource=self.resource,
             query_count=self.queryCount,
             query_freq=query_freq,
-            user_freq=self.userFreq.most_common(),
-            column_freq=self.columnFreq.most_common(),
+            user_freq=user_freq,
+            unique_user_count=len(self.userFreq),
+            column_freq=column_freq,
+            timestamp_millis=self._bucket_ts_millis,
             bucket_duration=bucket_duration,
             resource_urn_builder=resource_urn_builder,
             user_urn_builder=user_urn_builder,
@@ -219,9 +333,18 @@ class UsageAggregator(Generic[ResourceType]):
 
     def __init__(self, config: BaseUsageConfig):
         self.config = config
+        # Flat (bucket, resource) keys: one lookup per event instead of two,
+        # and no throwaway GenericAggregatedDataset built on cache hits.
         self.aggregation: Dict[
-            datetime, Dict[ResourceType, GenericAggregatedDataset[ResourceType]]
-        ] = defaultdict(dict)
+            Tuple[datetime, ResourceType], GenericAggregatedDataset[ResourceType]
+        ] = {}
+        # Collapse configs equivalent to allow-all onto the shared default so
+        # add_read_entry can skip pattern evaluation entirely.
+        self._user_email_pattern = (
+            _ALLOW_ALL_PATTERN
+            if config.user_email_pattern == _ALLOW_ALL_PATTERN
+            else config.user_email_pattern
+        )
 
     def aggregate_event(
         self,
@@ -232,34 +355,130 @@ class UsageAggregator(Generic[ResourceType]):
         user: Optional[str],
         fields: List[str],
     ) -> None:
-        floored_ts: datetime = get_time_bucket(start_time, self.config.bucket_duration)
-        self.aggregation[floored_ts].setdefault(
-            resource,
-            GenericAggregatedDataset[ResourceType](
-                bucket_start_time=floored_ts,
-                resource=resource,
-            ),
-        ).add_read_entry(
-            user,
-            query,
-            fields,
-        )
+        self.aggregate_events([(resource, start_time, query, user, fields)])
+
+    def aggregate_events(
+        self,
+        events: Iterable[
+            Tuple[ResourceType, datetime, Optional[str], Optional[str], List[str]]
+        ],
+    ) -> None:
+        """Aggregates a batch of (resource, start_time, query, user, fields)
+        tuples, amortizing the per-event attribute lookups across the batch."""
+        bucket_duration = self.config.bucket_duration
+        aggregation = self.aggregation
+        # Do the allow/deny filtering here, once per event, so add_read_entry
+        # runs with its no-op default pattern.
+        user_email_pattern = self._user_email_pattern
+        check_pattern = user_email_pattern is not _ALLOW_ALL_PATTERN
+        for resource, start_time, query, user, fields in events:
+            if check_pattern and user and not user_email_pattern.allowed(user):
+                continue
+            floored_ts = get_time_bucket(start_time, bucket_duration)
+            key = (floored_ts, resource)
+            agg = aggregation.get(key)
+            if agg is None:
+                agg = aggregation[key] = GenericAggregatedDataset[ResourceType](
+                    bucket_start_time=floored_ts,
+                    resource=resource,
+                )
+            agg.add_read_entry(
+                user,
+                query,
+                fields,
+            )
+
+    def fork(self) -> "UsageAggregator[ResourceType]":
+        """Returns a fresh aggregator sharing this one's config.
+
+        Intended for thread-local aggregation: fan events out to one fork
+        per worker, then combine them with merge() once the workers finish,
+        instead of contending on a single shared aggregation map.
+        """
+        return UsageAggregator(self.config)
+
+    def merge(self, other: "UsageAggregator[ResourceType]") -> None:
+        """Folds another aggregator's buckets into this one.
+
+        The other aggregator's state is absorbed and should not be used
+        afterwards.
+        """
+        aggregation = self.aggregation
+        for key, other_agg in other.aggregation.items():
+            agg = aggregation.get(key)
+            if agg is None:
+                aggregation[key] = other_agg
+                continue
+            agg.readCount += other_agg.readCount
+            agg.queryCount += other_agg.queryCount
+            # dict.update runs in C; use it wholesale when the destination
+            # map is empty and fall back to per-key addition otherwise.
+            for dst, src in (
+                (agg.queryFreq, other_agg.queryFreq),
+                (agg.userFreq, other_agg.userFreq),
+            ):
+                if not dst:
+                    dst.update(src)
+                else:
+                    for key2, count in src.items():
+                        dst[key2] += count
+            agg.columnFreq.update(other_agg.columnFreq)
+        other.aggregation = {}
+
+    def generate_expired_workunits(
+        self,
+        watermark: datetime,
+        resource_urn_builder: Callable[[ResourceType], str],
+        user_urn_builder: Optional[Callable[[str], str]] = None,
+    ) -> Iterable[MetadataWorkUnit]:
+        """Emits and evicts aggregates whose bucket started before `watermark`.
+
+        Sources that process events in rough time order can call this
+        periodically to keep memory bounded to the open window on long
+        backfills, instead of holding every bucket until the final
+        generate_workunits pass.
+        """
+        expired = [key for key in self.aggregation if key[0] < watermark]
+        config = self.config
+        user_urn_builder = _memoized_user_urn_builder(user_urn_builder)
+        for key in expired:
+            aggregate = self.aggregation.pop(key)
+            yield aggregate.make_usage_workunit(
+                bucket_duration=config.bucket_duration,
+                top_n_queries=config.top_n_queries,
+                format_sql_queries=config.format_sql_queries,
+                include_top_n_queries=config.include_top_n_queries,
+                resource_urn_builder=resource_urn_builder,
+                user_urn_builder=user_urn_builder,
+            )
 
     def generate_workunits(
         self,
         resource_urn_builder: Callable[[ResourceType], str],
         user_urn_builder: Optional[Callable[[str], str]] = None,
     ) -> Iterable[MetadataWorkUnit]:
-        for time_bucket in self.aggregation.values():
-            for aggregate in time_bucket.values():
-                yield aggregate.make_usage_workunit(
-                    bucket_duration=self.config.bucket_duration,
-                    top_n_queries=self.config.top_n_queries,
-                    format_sql_queries=self.config.format_sql_queries,
-                    include_top_n_queries=self.config.include_top_n_queries,
-                    resource_urn_builder=resource_urn_builder,
-                    user_urn_builder=user_urn_builder,
-                )
+        # The config is invariant across buckets; resolve it once instead of
+        # re-reading pydantic fields for every emitted workunit.
+        config = self.config
+        bucket_duration = config.bucket_duration
+        top_n_queries = config.top_n_queries
+        format_sql_queries = config.format_sql_queries
+        include_top_n_queries = config.include_top_n_queries
+        user_urn_builder = _memoized_user_urn_builder(user_urn_builder)
+        # Pop aggregates as they are emitted so their frequency maps become
+        # collectable immediately instead of living until the aggregator is
+        # GC'd; this makes generate_workunits single-shot.
+        aggregation = self.aggregation
+        while aggregation:
+            _, aggregate = aggregation.popitem()
+            yield aggregate.make_usage_workunit(
+                bucket_duration=bucket_duration,
+                top_n_queries=top_n_queries,
+                format_sql_queries=format_sql_queries,
+                include_top_n_queries=include_top_n_queries,
+                resource_urn_builder=resource_urn_builder,
+                user_urn_builder=user_urn_builder,
+            )
 
 
 @deprecated
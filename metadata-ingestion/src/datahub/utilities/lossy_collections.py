@@ -18,7 +18,7 @@ class LossyList(List[T]):
     def append(self, __object: T) -> None:
         try:
             if self.total_elements >= self.max_elements:
-                i = random.choice(range(0, self.total_elements + 1))
+                i = random.randint(0, self.total_elements)
                 if i < self.max_elements:
                     self.sampled = True
                     return super().__setitem__(i, (self.total_elements, __object))  # type: ignore
@@ -64,7 +64,7 @@ class LossySet(Set[T]):
             and super().__len__() >= self.max_elements
         ):
             self.sampled = True
-            i = random.choice(range(0, super().__len__()))
+            i = random.randint(0, super().__len__() - 1)
             if i < self.max_elements:
                 super().remove(list(super().__iter__())[i])
                 self._items_removed += 1
@@ -107,7 +107,7 @@ class LossyDict(Dict[_KT, _VT]):
         if not super().__contains__(__k) and super().__len__() >= self.max_elements:
             self.sampled = True
             self._overflow += 1
-            i = random.choice(range(0, super().__len__() + self._overflow))
+            i = random.randint(0, super().__len__() + self._overflow - 1)
             if i < self.max_elements:
                 super().pop(list(super().__iter__())[i])
                 self._items_removed += 1
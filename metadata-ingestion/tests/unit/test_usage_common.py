@@ -14,6 +14,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
     GenericAggregatedDataset,
+    UsageAggregator,
     convert_usage_aggregation_class,
 )
 from datahub.metadata.schema_classes import (
@@ -306,6 +307,102 @@ def test_make_usage_workunit_include_top_n_queries():
     assert du.topSqlQueries is None
 
 
+def test_usage_aggregator_merge():
+    config = BaseUsageConfig()
+    day1 = get_time_bucket(datetime(2020, 1, 1), BucketDuration.DAY)
+    day2 = get_time_bucket(datetime(2020, 1, 2), BucketDuration.DAY)
+    resource = "test_db.test_schema.test_table"
+    other_resource = "test_db.test_schema.other_table"
+
+    aggregator = UsageAggregator[_TestTableRef](config)
+    aggregator.aggregate_event(
+        resource=resource,
+        start_time=day1,
+        query="select a from test",
+        user="user1@test.com",
+        fields=["a"],
+    )
+
+    shard = aggregator.fork()
+    # Overlapping (bucket, resource) key.
+    shard.aggregate_event(
+        resource=resource,
+        start_time=day1,
+        query="select a from test",
+        user="user2@test.com",
+        fields=["a", "b"],
+    )
+    # Disjoint keys: new resource in the same bucket, same resource in a
+    # new bucket.
+    shard.aggregate_event(
+        resource=other_resource,
+        start_time=day1,
+        query="select * from other",
+        user="user1@test.com",
+        fields=[],
+    )
+    shard.aggregate_event(
+        resource=resource,
+        start_time=day2,
+        query="select a from test",
+        user="user1@test.com",
+        fields=["a"],
+    )
+
+    aggregator.merge(shard)
+    assert shard.aggregation == {}
+
+    merged = aggregator.aggregation[(day1, resource)]
+    assert merged.readCount == 2
+    assert merged.queryCount == 2
+    assert merged.queryFreq["select a from test"] == 2
+    assert merged.userFreq["user1@test.com"] == 1
+    assert merged.userFreq["user2@test.com"] == 1
+    assert merged.columnFreq["a"] == 2
+    assert merged.columnFreq["b"] == 1
+
+    moved = aggregator.aggregation[(day1, other_resource)]
+    assert moved.readCount == 1
+    assert moved.queryFreq["select * from other"] == 1
+    assert aggregator.aggregation[(day2, resource)].readCount == 1
+
+
+def test_usage_aggregator_expired_workunits():
+    config = BaseUsageConfig()
+    day1 = get_time_bucket(datetime(2020, 1, 1), BucketDuration.DAY)
+    day2 = get_time_bucket(datetime(2020, 1, 2), BucketDuration.DAY)
+    resource = "test_db.test_schema.test_table"
+
+    aggregator = UsageAggregator[_TestTableRef](config)
+    for bucket in [day1, day2]:
+        aggregator.aggregate_event(
+            resource=resource,
+            start_time=bucket,
+            query="select * from test",
+            user="test_email@test.com",
+            fields=[],
+        )
+
+    expired = list(
+        aggregator.generate_expired_workunits(
+            watermark=day2,
+            resource_urn_builder=_simple_urn_builder,
+        )
+    )
+    assert len(expired) == 1
+    du: DatasetUsageStatisticsClass = expired[0].get_metadata()["metadata"].aspect
+    assert du.timestampMillis == int(day1.timestamp() * 1000)
+
+    # The post-watermark bucket is retained and still emitted normally.
+    assert list(aggregator.aggregation) == [(day2, resource)]
+    remaining = list(
+        aggregator.generate_workunits(resource_urn_builder=_simple_urn_builder)
+    )
+    assert len(remaining) == 1
+    du = remaining[0].get_metadata()["metadata"].aspect
+    assert du.timestampMillis == int(day2.timestamp() * 1000)
+
+
 @freeze_time("2023-01-01 00:00:00")
 def test_convert_usage_aggregation_class():
     urn = make_dataset_urn_with_platform_instance(